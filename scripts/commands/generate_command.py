@@ -55,6 +55,11 @@ class GenerateCommand(BaseCommand):
             action="store_true",
             help="Show what would be generated without creating files",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate even if the CSV source is unchanged since the last run",
+        )
         parser.add_argument(
             "--inventory-key",
             choices=["hostname", "cname"],
@@ -81,6 +86,7 @@ class GenerateCommand(BaseCommand):
             result = inventory_manager.generate_inventories(
                 environments=args.environments,
                 dry_run=args.dry_run,
+                force=getattr(args, "force", False),
             )
 
             # Extract statistics from the result
@@ -108,6 +114,7 @@ class GenerateCommand(BaseCommand):
                     "host_vars_dir": str(inventory_manager.config.host_vars_dir),
                 },
                 "inventory_key": getattr(args, "inventory_key", "hostname"),
+                "cached": result.get("cached", False),
             }
 
             return CommandResult(
@@ -281,6 +288,11 @@ class GenerateCommand(BaseCommand):
                 f"   Generation time: {stats.get('generation_time', 0)}s",
             ]
 
+            if data.get("cached"):
+                lines.append(
+                    "   Reused previous result (CSV and configuration unchanged)"
+                )
+
             # Add orphaned files cleanup info
             orphaned_removed = stats.get("orphaned_files_removed", 0)
             if orphaned_removed > 0:
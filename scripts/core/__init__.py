@@ -27,6 +27,7 @@ from .config import (
 )
 from .models import Host, InventoryConfig, InventoryStats, ValidationResult
 from .utils import (
+    clear_csv_cache,
     create_backup_file,
     ensure_directory_exists,
     get_csv_template,
@@ -34,7 +35,9 @@ from .utils import (
     get_hosts_by_status,
     get_logger,
     load_csv_data,
+    load_csv_rows,
     load_hosts_from_csv,
+    save_structured_file,
     save_yaml_file,
     setup_logging,
     test_ansible_inventory,
@@ -64,6 +67,8 @@ __all__ = [
     "get_logger",
     "setup_logging",
     "load_csv_data",
+    "load_csv_rows",
+    "clear_csv_cache",
     "validate_hostname_decorator",
     "validate_environment_decorator",
     "validate_csv_headers",
@@ -75,6 +80,7 @@ __all__ = [
     "ensure_directory_exists",
     "create_backup_file",
     "save_yaml_file",
+    "save_structured_file",
     "test_ansible_inventory",
     # Models exports
     "Host",
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Low-level file I/O helpers for Ansible Inventory Management.
+
+This module keeps the raw I/O used by the CSV loaders and file generators in
+one place so the calling code only ever deals with in-memory buffers.
+"""
+
+import mmap
+import os
+import queue
+from pathlib import Path
+from typing import BinaryIO
+
+# Files at least this large get a sequential read-ahead hint
+LARGE_FILE_THRESHOLD = 1 << 20
+
+# Files at least this large are decoded from a memory mapping
+MMAP_THRESHOLD = 64 << 10
+
+# Reusable read buffers shared by all threads; larger buffers are not kept
+_BUF_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=8)
+_POOLED_BUF_SIZE = 1 << 20
+_MAX_POOLED_BUF_SIZE = 8 << 20
+
+
+def read_all(path: Path) -> bytes:
+    """Read a whole file into memory with as few syscalls as possible.
+
+    The file size is taken from ``fstat`` and requested in a single
+    ``os.read`` call, bypassing the chunked loop of a buffered reader.
+    Short reads (e.g. a file growing while being read) are handled by
+    continuing until end of file.
+
+    Args:
+        path: Path of the file to read.
+
+    Returns:
+        The file contents as bytes.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+
+        if size >= LARGE_FILE_THRESHOLD and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+
+        chunks = []
+        remaining = max(size, 1)
+        while True:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining = max(remaining - len(chunk), 1 << 16)
+
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def write_all(path: Path, data: bytes) -> None:
+    """Replace a file's contents with ``data`` using raw ``os.write`` calls.
+
+    The file is created with the same permissions ``open()`` would give it
+    and written without an intermediate buffered writer. No ``fsync`` is
+    issued; generated files can always be rebuilt from their source.
+
+    Args:
+        path: Path of the file to write.
+        data: Complete new contents of the file.
+    """
+    fd = os.open(
+        path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666
+    )
+    try:
+        with memoryview(data) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+
+def read_text(path: Path, encoding: str = "utf-8") -> str:
+    """Read and decode a whole file without an intermediate ``bytes`` copy.
+
+    Files of at least ``MMAP_THRESHOLD`` bytes are memory-mapped and decoded
+    straight from the page cache. Smaller files, where mapping costs more
+    than it saves, are read into a reusable ``bytearray`` from a shared pool.
+
+    Args:
+        path: Path of the file to read.
+        encoding: Text encoding of the file.
+
+    Returns:
+        The decoded file contents.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            return _decode_mapped(f, encoding)
+        return _decode_pooled(f, size, encoding)
+
+
+def _decode_mapped(f: BinaryIO, encoding: str) -> str:
+    """Decode a file straight from a read-only memory mapping."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return str(mm, encoding)
+
+
+def _decode_pooled(f: BinaryIO, size: int, encoding: str) -> str:
+    """Read ``size`` bytes into a pooled buffer and decode them."""
+    try:
+        buf = _BUF_POOL.get_nowait()
+    except queue.Empty:
+        buf = bytearray(_POOLED_BUF_SIZE)
+
+    try:
+        if len(buf) < size:
+            buf = bytearray(size)
+
+        filled = 0
+        with memoryview(buf) as view:
+            while filled < size:
+                n = f.readinto(view[filled:size])
+                if not n:
+                    break
+                filled += n
+
+            # The file grew after fstat; pick up the remainder
+            tail = f.read() if filled == size else b""
+            if tail:
+                return str(bytes(view[:filled]) + tail, encoding)
+            return str(view[:filled], encoding)
+    finally:
+        if len(buf) <= _MAX_POOLED_BUF_SIZE:
+            try:
+                _BUF_POOL.put_nowait(buf)
+            except queue.Full:
+                pass
@@ -10,10 +10,17 @@ import os
 import re
 import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YAML_LOADER  # type: ignore[assignment]
+
 
 def _get_version_from_pyproject() -> str:
     """Get version from pyproject.toml file.
@@ -62,17 +69,36 @@ SCRIPT_DIR: Path = Path(__file__).parent.parent
 # Configuration file path
 CONFIG_FILE: Path = PROJECT_ROOT / "inventory-config.yml"
 
-# Global configuration cache
+# Global configuration cache, valid while the config file is unchanged
 _config_cache: Optional[Dict[str, Any]] = None
+_config_cache_key: Optional[Tuple[str, int, int]] = None
 _config_lock = threading.Lock()
 
+# Location code -> environment info, derived from the cached configuration
+_location_code_map: Optional[Mapping[str, Mapping[str, str]]] = None
+
+
+def _config_file_key() -> Tuple[str, int, int]:
+    """Identify the current config file by path, modification time and size."""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return (str(CONFIG_FILE), -1, -1)
+    return (str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
+
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from YAML file with caching."""
-    global _config_cache
+    """Load configuration from YAML file with caching.
+
+    The parsed configuration is reused until the config file path, its
+    modification time or its size changes, so repeated calls only cost a
+    ``stat``.
+    """
+    global _config_cache, _config_cache_key, _location_code_map
 
     with _config_lock:
-        if _config_cache is not None:
+        cache_key = _config_file_key()
+        if _config_cache is not None and _config_cache_key == cache_key:
             return _config_cache
 
         # Minimal essential defaults (only for critical functionality)
@@ -104,7 +130,7 @@ def load_config() -> Dict[str, Any]:
         if CONFIG_FILE.exists():
             try:
                 with CONFIG_FILE.open("r", encoding="utf-8") as f:
-                    yaml_config = yaml.safe_load(f) or {}
+                    yaml_config = yaml.load(f, Loader=_YAML_LOADER) or {}
                     # Merge with minimal defaults (YAML overrides defaults)
                     config = _deep_merge(minimal_defaults, yaml_config)
             except yaml.YAMLError as e:
@@ -129,6 +155,8 @@ def load_config() -> Dict[str, Any]:
         config = _apply_env_overrides(config)
 
         _config_cache = config
+        _config_cache_key = cache_key
+        _location_code_map = None
         return config
 
 
@@ -191,10 +219,18 @@ def get_config() -> Dict[str, Any]:
     return load_config()
 
 
+def reset_config_cache() -> None:
+    """Drop the cached configuration so the next load reads the file again."""
+    global _config_cache, _config_cache_key, _location_code_map
+    with _config_lock:
+        _config_cache = None
+        _config_cache_key = None
+        _location_code_map = None
+
+
 def reload_config() -> Dict[str, Any]:
     """Force reload configuration from file."""
-    global _config_cache
-    _config_cache = None
+    reset_config_cache()
     return load_config()
 
 
@@ -538,15 +574,32 @@ class ErrorMessages:
         return template.format(**kwargs)
 
 
+def _get_location_code_map() -> Mapping[str, Mapping[str, str]]:
+    """Build the read-only location code lookup once per loaded configuration."""
+    global _location_code_map
+    # Loading first drops a map built from a configuration that has changed
+    config = load_config()
+    if _location_code_map is None:
+        mapping = config.get("location_codes", {})
+        _location_code_map = MappingProxyType(
+            {
+                code: MappingProxyType(
+                    {
+                        "name": entry.get("name"),
+                        "inventory_file": entry.get("inventory_file"),
+                    }
+                )
+                for code, entry in mapping.items()
+                if entry
+            }
+        )
+    return _location_code_map
+
+
 def get_environment_info_from_code(code: str) -> Optional[Dict[str, str]]:
     """Map a location/environment code (e.g. PRD) to full environment name and inventory filename.
     Returns a dict with keys 'name' and 'inventory_file', or None if not found."""
-    config = load_config()
-    mapping = config.get("location_codes", {})
-    entry = mapping.get(code.upper())
+    entry = _get_location_code_map().get(code.upper())
     if entry:
-        return {
-            "name": entry.get("name"),
-            "inventory_file": entry.get("inventory_file"),
-        }
+        return dict(entry)
     return None
@@ -6,13 +6,81 @@ safety, validation, and cleaner code organization.
 """
 
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+@lru_cache(maxsize=4096)
+def _group_name(prefix: str, value: str) -> str:
+    """Build an inventory group name, interned so every host shares one copy."""
+    return sys.intern(f"{prefix}_{value}")
+
+
+# Host fields that may be populated directly from a CSV column
+_HOST_CSV_FIELDS = frozenset(
+    {
+        "hostname",
+        "environment",
+        "status",
+        "application_service",
+        "site_code",
+        "instance",
+        "batch_number",
+        "patch_mode",
+        "dashboard_group",
+        "primary_application",
+        "function",
+        "ssl_port",
+        "decommission_date",
+        "cname",
+        "ansible_tags",
+    }
+)
+_INVENTORY_KEY_FIELDS = frozenset({"hostname", "cname"})
+
+# Instance numbers: 0 or a positive integer without leading zeros
+_INSTANCE_PATTERN = re.compile(r"0|[1-9]\d*")
+
+_PRODUCT_COLUMN = "product"
+_HOST_FIELD_COLUMN = "field"
+_METADATA_COLUMN = "metadata"
+
+
+@lru_cache(maxsize=1024)
+def _csv_column_kind(column: str) -> str:
+    """Classify a CSV column once instead of on every row."""
+    if column.startswith("product"):
+        return _PRODUCT_COLUMN
+    if column in _HOST_CSV_FIELDS:
+        return _HOST_FIELD_COLUMN
+    return _METADATA_COLUMN
+
+
+@lru_cache(maxsize=None)
+def _allowed_host_values() -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """Return the configured environments, statuses and patch modes as sets.
+
+    The configuration is imported on first use and the sets built only once,
+    so validating a host costs three hash lookups.
+    """
+    from .config import ENVIRONMENTS, VALID_PATCH_MODES, VALID_STATUS_VALUES
 
+    return (
+        frozenset(ENVIRONMENTS),
+        frozenset(VALID_STATUS_VALUES),
+        frozenset(VALID_PATCH_MODES),
+    )
 
-@dataclass
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Host:
     """Structured host data model with automatic validation.
 
@@ -65,6 +133,14 @@ class Host:
 
     def _validate_environment_and_status(self) -> None:
         """Validate environment and status fields."""
+        environments, status_values, patch_modes = _allowed_host_values()
+        if (
+            self.environment in environments
+            and self.status in status_values
+            and (not self.patch_mode or self.patch_mode in patch_modes)
+        ):
+            return
+
         from .config import (
             ENVIRONMENTS,
             VALID_PATCH_MODES,
@@ -72,19 +148,19 @@ class Host:
             ErrorMessages,
         )
 
-        if self.environment not in ENVIRONMENTS:
+        if self.environment not in environments:
             raise ValueError(
                 ErrorMessages.ENVIRONMENT_INVALID.format(
                     env=self.environment, valid_envs=", ".join(ENVIRONMENTS)
                 )
             )
 
-        if self.status not in VALID_STATUS_VALUES:
+        if self.status not in status_values:
             raise ValueError(
                 f"Invalid status: {self.status}. Must be one of: {VALID_STATUS_VALUES}"
             )
 
-        if self.patch_mode and self.patch_mode not in VALID_PATCH_MODES:
+        if self.patch_mode and self.patch_mode not in patch_modes:
             raise ValueError(
                 f"Invalid patch_mode: {self.patch_mode}. "
                 f"Must be one of: {VALID_PATCH_MODES}"
@@ -123,7 +199,7 @@ class Host:
         """Validate instance field."""
         if self.instance:
             # Allow 0 and positive integers without leading zeros
-            if self.instance == "0" or re.fullmatch(r"[1-9]\d*", self.instance):
+            if _INSTANCE_PATTERN.fullmatch(self.instance):
                 pass  # Valid instance
             else:
                 raise ValueError(
@@ -191,13 +267,13 @@ class Host:
     def get_app_group_name(self) -> Optional[str]:
         """Get application group name for inventory."""
         if self.application_service:
-            return f"app_{self.application_service}"
+            return _group_name("app", self.application_service)
         return None
 
     def get_batch_group_name(self) -> Optional[str]:
         """Get batch group name for inventory."""
         if self.batch_number:
-            return f"batch_{self.batch_number}"
+            return _group_name("batch", self.batch_number)
         return None
 
     def get_product_ids(self) -> List[str]:
@@ -221,7 +297,7 @@ class Host:
             List of product group names (e.g., ["product_web", "product_analytics"])
         """
         product_ids = self.get_product_ids()
-        return [f"product_{product_id}" for product_id in product_ids]
+        return [_group_name("product", product_id) for product_id in product_ids]
 
     def has_product(self, product_id: str) -> bool:
         """Check if host has a specific product installed.
@@ -365,25 +441,6 @@ class Host:
                 {"hostname": "host1", "environment": "production",
                  "product_1": "web", "product_2": "analytics", "product_3": "monitoring"}
         """
-        # Extract known fields
-        known_fields = {
-            "hostname",
-            "environment",
-            "status",
-            "application_service",
-            "site_code",
-            "instance",
-            "batch_number",
-            "patch_mode",
-            "dashboard_group",
-            "primary_application",
-            "function",
-            "ssl_port",
-            "decommission_date",
-            "cname",
-            "ansible_tags",
-        }
-
         host_data: Dict[str, Any] = {}
         metadata: Dict[str, Any] = {}
         products: Dict[str, str] = {}
@@ -393,18 +450,16 @@ class Host:
             if k is None:
                 continue
 
-            if isinstance(v, str):
-                clean_value = v.strip() if v is not None else None
-            else:
-                clean_value = v
+            clean_value = v.strip() if isinstance(v, str) else v
 
+            kind = _csv_column_kind(k)
             # Handle dynamic product columns
-            if k.startswith("product"):
+            if kind == _PRODUCT_COLUMN:
                 if clean_value:
                     products[k] = clean_value
             # Handle known fields
-            elif k in known_fields:
-                if k in ["hostname", "cname"] and not clean_value:
+            elif kind == _HOST_FIELD_COLUMN:
+                if k in _INVENTORY_KEY_FIELDS and not clean_value:
                     host_data[k] = None
                 else:
                     host_data[k] = clean_value if clean_value is not None else ""
@@ -418,9 +473,13 @@ class Host:
         return cls(**host_data)  # type: ignore[unreachable]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
-    """Standardized validation result."""
+    """Standardized validation result.
+
+    ``is_valid`` is a stored flag cleared by ``add_error``, so reading it
+    never walks ``errors``.
+    """
 
     is_valid: bool = True
     errors: List[str] = field(default_factory=list)
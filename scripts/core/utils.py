@@ -7,6 +7,7 @@ management scripts to eliminate code duplication and ensure consistency.
 
 import contextlib
 import csv
+import io
 
 try:
     import fcntl
@@ -18,18 +19,54 @@ try:
 except ImportError:  # pragma: no cover - POSIX
     msvcrt = None  # type: ignore
 
+import json
 import logging
 import os
 import re
+import string
 import subprocess
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yaml
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None  # type: ignore
+    pa_compute = None  # type: ignore
+    pa_csv = None  # type: ignore
+
+# Prefer the libyaml-backed safe dumper/loader when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as YAML_DUMPER
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YAML_DUMPER  # type: ignore[assignment]
+    from yaml import SafeLoader as YAML_LOADER  # type: ignore[assignment]
+
+from ._io import read_text
 from .models import ValidationResult
 
 try:
@@ -116,18 +153,43 @@ def load_csv_data(
         ValueError: If required fields are missing.
     """
     csv_file = _resolve_csv_file(csv_file)
+    hosts = list(load_csv_rows(csv_file, required_fields, inventory_key))
 
-    try:
-        with file_lock(csv_file, "r", timeout=10) as f:
-            reader = csv.DictReader(f)
-            _validate_csv_fields(reader, required_fields)
-            hosts = _process_csv_rows(reader, inventory_key)
+    log_security_event(
+        "CSV_READ", f"Successfully loaded {len(hosts)} hosts from {csv_file}"
+    )
+    return hosts
 
-            log_security_event(
-                "CSV_READ", f"Successfully loaded {len(hosts)} hosts from {csv_file}"
-            )
-            return hosts
 
+def load_csv_rows(
+    csv_file: Optional[Path] = None,
+    required_fields: Optional[List[str]] = None,
+    inventory_key: str = "hostname",
+) -> Iterator[Dict[str, str]]:
+    """Lazily yield cleaned CSV rows, one dictionary at a time.
+
+    The file is read and validated up front, so errors are raised by this
+    call rather than during iteration. Use it instead of
+    :func:`load_csv_data` when rows are only filtered or aggregated.
+
+    Args:
+        csv_file: Path to CSV file. Uses default if None.
+        required_fields: Required field names to validate.
+        inventory_key: Primary key to use for inventory ("hostname" or "cname").
+
+    Returns:
+        Iterator over dictionaries representing CSV rows.
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist.
+        ValueError: If required fields are missing.
+    """
+    csv_file = _resolve_csv_file(csv_file)
+
+    try:
+        with file_lock(csv_file, "r", timeout=10):
+            cache_key = _csv_cache_key(csv_file)
+            fieldnames, _ = _scan_csv_bytes(*cache_key)
     except TimeoutError:
         log_security_event(
             "FILE_LOCK_TIMEOUT", f"Could not acquire lock on {csv_file}", "ERROR"
@@ -136,6 +198,31 @@ def load_csv_data(
     except csv.Error as e:
         raise ValueError(f"CSV parsing error: {e}")
 
+    _validate_csv_fields(fieldnames, required_fields)
+
+    # Hand out copies so callers may modify rows without touching the cache
+    cleaned_rows = _cleaned_csv_rows(*cache_key, inventory_key)
+    return (dict(row) for row in cleaned_rows)
+
+
+def clear_csv_cache() -> None:
+    """Drop all cached CSV parses.
+
+    Cached entries are keyed on path, modification time and size, so this
+    is only needed when a file may change without either being updated.
+    """
+    _scan_csv_bytes.cache_clear()
+    _cleaned_csv_rows.cache_clear()
+
+
+# System and user directories kept out of error messages
+_SENSITIVE_PATH_PATTERN = re.compile(r"(?:/etc|/home|[A-Za-z]:)(?P<sep>[/\\])")
+
+
+def _redact_path(path: Union[str, Path]) -> str:
+    """Return ``path`` with system and home directory prefixes masked."""
+    return _SENSITIVE_PATH_PATTERN.sub(r"<redacted>\g<sep>", str(path))
+
 
 def _resolve_csv_file(csv_file: Optional[Path]) -> Path:
     """Resolve and validate CSV file path."""
@@ -145,38 +232,207 @@ def _resolve_csv_file(csv_file: Optional[Path]) -> Path:
         csv_file = Path(csv_file)
 
     if not csv_file.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_file}")
+        raise FileNotFoundError(f"CSV file not found: {_redact_path(csv_file)}")
 
     return csv_file
 
 
+def _scan_csv_file(
+    csv_file: Path,
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]:
+    """Read and tokenize a CSV file, reusing the result while it is unchanged.
+
+    Returns:
+        Tuple of (header fields, data records).
+    """
+    return _scan_csv_bytes(*_csv_cache_key(csv_file))
+
+
+def _csv_cache_key(csv_file: Path) -> Tuple[str, int, int]:
+    """Return the (path, mtime_ns, size) key used by the CSV parse caches.
+
+    The file is opened rather than just stat'ed, so a file that has become
+    unreadable raises ``PermissionError`` instead of being served from cache.
+    """
+    fd = os.open(csv_file, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+    finally:
+        os.close(fd)
+    return str(csv_file), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=8)
+def _cleaned_csv_rows(
+    csv_path: str, mtime_ns: int, size: int, inventory_key: str
+) -> Tuple[Dict[str, str], ...]:
+    """Return the cleaned host rows of a scanned CSV file.
+
+    The dictionaries are shared between calls and must not be modified.
+    """
+    fieldnames, rows = _scan_csv_bytes(csv_path, mtime_ns, size)
+    return tuple(_iter_csv_rows(rows, fieldnames, inventory_key))
+
+
+@lru_cache(maxsize=8)
+def _scan_csv_bytes(
+    csv_path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]:
+    """Decode and split a CSV file in one pass.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key so that a
+    modified file is scanned again.
+    """
+    if size >= _ARROW_PARSE_THRESHOLD and _arrow_enabled():
+        scanned = _scan_csv_arrow(csv_path)
+        if scanned is not None:
+            return scanned
+
+    text = read_text(Path(csv_path))
+
+    workers = _csv_parse_workers(text)
+    if workers > 1:
+        header, _, body = text.partition("\n")
+        fieldnames = tuple(next(csv.reader([header]), []))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_tokenize_csv_rows, _split_csv_lines(body, workers))
+            rows = tuple(chain.from_iterable(parts))
+        return fieldnames, rows
+
+    reader = csv.reader(io.StringIO(text))
+    fieldnames = tuple(next(reader, []))
+    rows = tuple(tuple(row) for row in reader if row)
+    return fieldnames, rows
+
+
+# Files at least this large are parsed with pyarrow when it is installed
+_ARROW_PARSE_THRESHOLD = 64 << 10
+
+
+def _arrow_enabled() -> bool:
+    """Return True if pyarrow is installed and not disabled via PREFER_ARROW.
+
+    Set ``PREFER_ARROW=0`` to force the stdlib csv reader.
+    """
+    if pa_csv is None:
+        return False
+    preference = os.environ.get("PREFER_ARROW", "1").strip().lower()
+    return preference not in ("0", "false", "no", "off")
+
+
+def _scan_csv_arrow(
+    csv_path: str,
+) -> Optional[Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]]:
+    """Tokenize a CSV file with pyarrow's multi-threaded C++ reader.
+
+    Every column is read as a string so values match the stdlib reader.
+    Returns None for input pyarrow handles differently (ragged rows,
+    duplicate or missing headers, invalid UTF-8, oversized fields); the
+    caller then falls back to the stdlib path.
+    """
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        fieldnames = tuple(next(csv.reader(f), []))
+    if not fieldnames or len(set(fieldnames)) != len(fieldnames):
+        return None
+
+    try:
+        # Parse straight from the page cache instead of copying the file
+        # through a buffered reader
+        with pa.memory_map(csv_path) as source:
+            table = pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(block_size=1 << 20),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in fieldnames},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+    except (pa.ArrowException, OSError):
+        return None
+
+    if tuple(table.column_names) != fieldnames:
+        return None
+
+    # Let the stdlib reader report fields over csv.field_size_limit()
+    limit = csv.field_size_limit()
+    for column in table.columns:
+        longest = pa_compute.max(pa_compute.utf8_length(column)).as_py()
+        if longest is not None and longest > limit:
+            return None
+
+    columns = [column.to_pylist() for column in table.columns]
+    return fieldnames, tuple(zip(*columns))
+
+
+# CSV text at least this long is tokenized by several threads when possible
+_PARALLEL_PARSE_THRESHOLD = 4 << 20
+
+
+def _csv_parse_workers(text: str) -> int:
+    """Return how many threads should tokenize ``text`` (1 means serial).
+
+    Splitting on newlines is only safe without quoted fields, which may
+    contain line breaks. Threads only help when the interpreter runs
+    without the GIL (free-threaded builds).
+    """
+    if len(text) < _PARALLEL_PARSE_THRESHOLD or not _gil_disabled():
+        return 1
+    if '"' in text:
+        return 1
+    return min(os.cpu_count() or 1, 8)
+
+
+def _gil_disabled() -> bool:
+    """Return True on a free-threaded interpreter with the GIL turned off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _split_csv_lines(text: str, parts: int) -> List[str]:
+    """Split ``text`` into at most ``parts`` chunks on line boundaries."""
+    chunks = []
+    start = 0
+    step = max(len(text) // parts, 1)
+    while start < len(text):
+        end = text.find("\n", start + step)
+        if end == -1:
+            chunks.append(text[start:])
+            break
+        chunks.append(text[start : end + 1])
+        start = end + 1
+    return chunks
+
+
+def _tokenize_csv_rows(chunk: str) -> List[Tuple[str, ...]]:
+    """Tokenize one chunk of CSV records, dropping blank lines."""
+    return [tuple(row) for row in csv.reader(io.StringIO(chunk)) if row]
+
+
 def _validate_csv_fields(
-    reader: csv.DictReader, required_fields: Optional[List[str]]
+    fieldnames: Sequence[str], required_fields: Optional[List[str]]
 ) -> None:
     """Validate that required fields are present in CSV."""
     if required_fields:
-        missing_fields = set(required_fields) - set(reader.fieldnames or [])
+        missing_fields = set(required_fields) - set(fieldnames)
         if missing_fields:
             raise ValueError(f"Missing required CSV fields: {missing_fields}")
 
 
-def _process_csv_rows(
-    reader: csv.DictReader, inventory_key: str
-) -> List[Dict[str, str]]:
-    """Process CSV rows and return cleaned data."""
-    hosts: List[Dict[str, str]] = []
-
-    for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-        primary_id = _extract_primary_identifier(row, inventory_key)
+def _iter_csv_rows(
+    rows: Iterable[Sequence[str]], fieldnames: Sequence[str], inventory_key: str
+) -> Iterator[Dict[str, str]]:
+    """Yield cleaned CSV rows, skipping comments and empty rows."""
+    for row in rows:
+        cleaned_row = _clean_csv_row(fieldnames, row)
+        primary_id = _extract_primary_identifier(cleaned_row, inventory_key)
 
         # Skip comments and empty rows
         if not primary_id or primary_id.startswith("#"):
             continue
 
-        cleaned_row = _clean_csv_row(row)
-        hosts.append(cleaned_row)
-
-    return hosts
+        yield cleaned_row
 
 
 def _extract_primary_identifier(row: Dict[str, str], inventory_key: str) -> str:
@@ -195,43 +451,86 @@ def _extract_primary_identifier(row: Dict[str, str], inventory_key: str) -> str:
         return hostname or cname
 
 
-def _clean_csv_row(row: Dict[str, str]) -> Dict[str, str]:
-    """Clean up a single CSV row."""
-    cleaned_row = {}
+# Low-cardinality columns whose values are shared across rows
+_INTERNED_CSV_FIELDS = frozenset(
+    {
+        "environment",
+        "status",
+        "application_service",
+        "site_code",
+        "batch_number",
+        "patch_mode",
+        "dashboard_group",
+    }
+)
 
-    for k, v in row.items():
-        if k == "product_id":
-            # Handle None values in product_id
-            if v is None:
-                cleaned_row[k] = ""
-            else:
-                cleaned_row[k] = ",".join(item.strip() for item in str(v).split(","))
-        else:
-            # Safe handling of None values
-            if v is None:
-                cleaned_row[k] = ""
-            else:
-                cleaned_row[k] = str(v).strip() if str(v) else ""
+
+def _clean_csv_row(fieldnames: Sequence[str], row: Sequence[str]) -> Dict[str, str]:
+    """Build a cleaned row dictionary from a raw CSV record.
+
+    Mirrors csv.DictReader semantics: missing trailing fields become empty
+    strings and surplus fields are collected under the ``None`` key.
+    Values that need no stripping are the scanned strings themselves, so
+    loading a cached file does not copy field data.
+    """
+    cleaned_row = {k: v.strip() for k, v in zip(fieldnames, row)}
+
+    num_fields = len(fieldnames)
+    if len(row) < num_fields:
+        for k in fieldnames[len(row) :]:
+            cleaned_row[k] = ""
+    elif len(row) > num_fields:
+        cleaned_row[None] = str(list(row[num_fields:])).strip()  # type: ignore[index]
+
+    for k in _INTERNED_CSV_FIELDS.intersection(cleaned_row):
+        cleaned_row[k] = sys.intern(cleaned_row[k])
+
+    product_id = cleaned_row.get("product_id")
+    if product_id:
+        cleaned_row["product_id"] = ",".join(
+            item.strip() for item in product_id.split(",")
+        )
 
     return cleaned_row
 
 
+# Shell metacharacters rejected in ansible command arguments
+_UNSAFE_ARG_PATTERN = re.compile(r"[;&|`$<>]")
+
+# Characters allowed in hostnames; a set check avoids running the regex VM
+_HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_ENVIRONMENT_SET = frozenset(ENVIRONMENTS)
+
+
+@lru_cache(maxsize=4096)
+def _hostname_argument_error(hostname: str) -> Optional[str]:
+    """Return the decorator error for ``hostname`` or None if it is acceptable."""
+    hostname = hostname.strip()
+    if not hostname:
+        return "Hostname is required and cannot be empty"
+
+    # Basic hostname validation
+    if len(hostname) > 63:
+        return "Hostname too long (max 63 characters)"
+
+    if not hostname.replace("-", "").replace("_", "").isalnum():
+        return "Hostname contains invalid characters"
+
+    return None
+
+
 def validate_hostname_decorator(func: Any) -> Any:
     """Validate the hostname parameter before calling ``func``."""
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         hostname = kwargs.get("hostname") or (args[0] if args else None)
-        if not hostname or not hostname.strip():
+        if not hostname:
             raise ValueError("Hostname is required and cannot be empty")
 
-        # Basic hostname validation
-        hostname = hostname.strip()
-        if len(hostname) > 63:
-            raise ValueError("Hostname too long (max 63 characters)")
-
-        if not hostname.replace("-", "").replace("_", "").isalnum():
-            raise ValueError("Hostname contains invalid characters")
+        error = _hostname_argument_error(hostname)
+        if error:
+            raise ValueError(error)
 
         return func(*args, **kwargs)
 
@@ -244,7 +543,7 @@ def validate_environment_decorator(func: Any) -> Any:
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         environment = kwargs.get("environment")
-        if environment and environment not in ENVIRONMENTS:
+        if environment and environment not in _ENVIRONMENT_SET:
             raise ValueError(
                 f"Invalid environment '{environment}'. "
                 f"Must be one of: {', '.join(ENVIRONMENTS)}"
@@ -270,22 +569,63 @@ def load_hosts_from_csv(csv_file: Optional[str] = None) -> List[Dict[str, str]]:
     if csv_file is None:
         csv_file = str(CSV_FILE)
 
-    hosts: List[Dict[str, str]] = []
+    return _select_csv_hosts(csv_file)
+
+
+def _select_csv_hosts(
+    csv_file: Optional[str],
+    column: Optional[str] = None,
+    matches: Optional[Callable[[str], bool]] = None,
+) -> List[Dict[str, str]]:
+    """Return host rows from ``csv_file``, optionally filtered on one column.
+
+    Filtering works on the tokenized records column by column, so row
+    dictionaries are only built for the hosts that are returned.
+    """
+    if csv_file is None:
+        csv_file = str(CSV_FILE)
+
     if not os.path.exists(csv_file):
-        raise FileNotFoundError(f"CSV file not found: {csv_file}")
+        raise FileNotFoundError(f"CSV file not found: {_redact_path(csv_file)}")
 
     try:
-        with open(csv_file, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                hostname = row.get("hostname", "").strip()
-                if hostname and not hostname.startswith("#"):
-                    hosts.append(row)
+        fieldnames, rows = _scan_csv_file(Path(csv_file))
     except Exception as e:
         logger = get_logger(__name__)
         logger.error(f"Error reading CSV file {csv_file}: {e}")
         raise ValueError(f"Failed to parse CSV file: {e}")
 
+    # Last occurrence wins for duplicate headers, as with csv.DictReader
+    positions = {name: i for i, name in enumerate(fieldnames)}
+    hostname_idx = positions.get("hostname")
+    column_idx = positions.get(column) if column else None
+    num_fields = len(fieldnames)
+
+    hosts: List[Dict[str, str]] = []
+    for record in rows:
+        if hostname_idx is None or hostname_idx >= len(record):
+            continue
+        hostname = record[hostname_idx].strip()
+        if not hostname or hostname.startswith("#"):
+            continue
+
+        if matches is not None:
+            value = (
+                record[column_idx]
+                if column_idx is not None and column_idx < len(record)
+                else ""
+            )
+            if not matches(value):
+                continue
+
+        host = dict(zip(fieldnames, record))
+        if len(record) < num_fields:
+            for name in fieldnames[len(record) :]:
+                host[name] = None  # type: ignore[assignment]
+        elif len(record) > num_fields:
+            host[None] = list(record[num_fields:])  # type: ignore[index]
+        hosts.append(host)
+
     return hosts
 
 
@@ -305,10 +645,9 @@ def get_hosts_by_environment(
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV file cannot be parsed
     """
-    all_hosts = load_hosts_from_csv(csv_file)
-    return [
-        host for host in all_hosts if host.get("environment", "").strip() == environment
-    ]
+    return _select_csv_hosts(
+        csv_file, "environment", lambda value: value.strip() == environment
+    )
 
 
 def get_hosts_by_status(
@@ -327,12 +666,10 @@ def get_hosts_by_status(
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV file cannot be parsed
     """
-    all_hosts = load_hosts_from_csv(csv_file)
-    return [
-        host
-        for host in all_hosts
-        if host.get("status", "").strip().lower() == status.lower()
-    ]
+    wanted = status.lower()
+    return _select_csv_hosts(
+        csv_file, "status", lambda value: value.strip().lower() == wanted
+    )
 
 
 def get_hostnames_from_csv(csv_file: Optional[str] = None) -> Set[str]:
@@ -409,7 +746,7 @@ def validate_environment(environment: str) -> Optional[str]:
     if not environment:
         return "Environment cannot be empty"
 
-    if environment not in ENVIRONMENTS:
+    if environment not in _ENVIRONMENT_SET:
         return f"Invalid environment '{environment}'. Must be one of: {', '.join(ENVIRONMENTS)}"
 
     return None
@@ -447,17 +784,25 @@ def validate_hostname(hostname: str) -> Optional[str]:
     Returns:
         Error message if invalid, None if valid
     """
-    if not hostname or not hostname.strip():
+    if not hostname:
         return "Hostname is required and cannot be empty"
 
+    return _validate_hostname(hostname)
+
+
+@lru_cache(maxsize=4096)
+def _validate_hostname(hostname: str) -> Optional[str]:
+    """Cached body of :func:`validate_hostname` for non-empty input."""
     hostname = hostname.strip()
+    if not hostname:
+        return "Hostname is required and cannot be empty"
 
     # Check length
     if len(hostname) > 63:
         return f"Hostname too long ({len(hostname)} chars). Maximum is 63 characters"
 
     # Check for valid characters (alphanumeric, hyphens, underscores)
-    if not re.match(r"^[a-zA-Z0-9_-]+$", hostname):
+    if not _HOSTNAME_CHARS.issuperset(hostname):
         return "Hostname contains invalid characters. Use only letters, numbers, hyphens, and underscores"
 
     # Check if starts/ends with hyphen
@@ -510,13 +855,12 @@ def run_ansible_command(
         return False, "", "Invalid command arguments"
 
     # Basic sanitization to avoid accidental shell injection
-    unsafe_pattern = re.compile(r"[;&|`$<>]")
     sanitized_args: List[str] = []
     for arg in args:
         if not isinstance(arg, str):
             logger.error("Non-string argument provided to run_ansible_command")
             return False, "", "Invalid command arguments"
-        if unsafe_pattern.search(arg):
+        if _UNSAFE_ARG_PATTERN.search(arg):
             logger.error(f"Unsafe characters detected in argument: {arg}")
             return False, "", "Unsafe characters in command arguments"
         sanitized_args.append(arg)
@@ -564,17 +908,75 @@ def run_ansible_command(
 
 
 def ensure_directory_exists(directory_path: str) -> None:
-    """Ensure directory exists, creating it if necessary."""
-    path = Path(directory_path)
-    path.mkdir(parents=True, exist_ok=True)
+    """Ensure directory exists, creating it and any parents if necessary.
+
+    Path.mkdir attempts the mkdir first and only stats on failure, so an
+    existing directory costs one mkdir plus one stat. os.makedirs would
+    stat the parent before even trying.
+
+    Raises:
+        PermissionError: If the directory cannot be created.
+        FileExistsError: If the path exists but is not a directory.
+    """
+    Path(directory_path).mkdir(parents=True, exist_ok=True)
+
 
+# Results of test_ansible_inventory keyed on (cwd, inventory fingerprint)
+_INVENTORY_TEST_CACHE: Dict[
+    Tuple[str, Tuple[int, int, int]], Tuple[float, bool, str]
+] = {}
+_INVENTORY_TEST_CACHE_TTL = 60.0
+_INVENTORY_TEST_CACHE_SIZE = 32
 
-def test_ansible_inventory() -> Tuple[bool, str]:
+
+def _inventory_fingerprint() -> Tuple[int, int, int]:
+    """Summarise the inventory tree as (file count, total size, newest mtime)."""
+    count = total_size = newest = 0
+    for root, _dirs, files in os.walk(INVENTORY_DIR):
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            count += 1
+            total_size += stat.st_size
+            newest = max(newest, stat.st_mtime_ns)
+    return count, total_size, newest
+
+
+def test_ansible_inventory(use_cache: bool = True) -> Tuple[bool, str]:
     """Test if ansible-inventory command works.
 
+    Successful results are reused for up to a minute while the inventory
+    directory is unchanged, which avoids spawning ansible-inventory on
+    repeated checks. Failures are never cached, so a fixed inventory is
+    picked up on the next call.
+
+    Args:
+        use_cache: Set to False to always run ansible-inventory.
+
     Returns:
         Tuple of (success, error_message)
     """
+    if not use_cache:
+        return _run_ansible_inventory_test()
+
+    key = (os.getcwd(), _inventory_fingerprint())
+    cached = _INVENTORY_TEST_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < _INVENTORY_TEST_CACHE_TTL:
+        return cached[1], cached[2]
+
+    result = _run_ansible_inventory_test()
+
+    if result[0]:
+        if len(_INVENTORY_TEST_CACHE) >= _INVENTORY_TEST_CACHE_SIZE:
+            _INVENTORY_TEST_CACHE.clear()
+        _INVENTORY_TEST_CACHE[key] = (time.monotonic(), *result)
+    return result
+
+
+def _run_ansible_inventory_test() -> Tuple[bool, str]:
+    """Run ansible-inventory and check that it prints valid JSON."""
     success, stdout, stderr = run_ansible_command(["ansible-inventory", "--list"])
 
     if not success:
@@ -582,8 +984,6 @@ def test_ansible_inventory() -> Tuple[bool, str]:
 
     # Check if output is valid JSON
     try:
-        import json
-
         json.loads(stdout)
         return True, ""
     except json.JSONDecodeError:
@@ -600,8 +1000,6 @@ def create_backup_file(source_file: str, backup_dir: Optional[str] = None) -> st
     Returns:
         Path to backup file
     """
-    import shutil
-
     source_path = Path(source_file)
 
     if backup_dir is None:
@@ -614,10 +1012,76 @@ def create_backup_file(source_file: str, backup_dir: Optional[str] = None) -> st
     backup_name = f"{source_path.stem}_backup_{timestamp}{source_path.suffix}"
     backup_path = backup_dir_path / backup_name
 
-    shutil.copy2(source_file, backup_path)
+    copy_file(source_file, str(backup_path))
     return str(backup_path)
 
 
+# Linux FICLONE ioctl request number (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+
+def copy_file(source_file: str, target_file: str) -> None:
+    """Copy a file and its metadata, keeping the data inside the kernel.
+
+    On Linux the copy is first attempted as a copy-on-write clone and then
+    with ``os.copy_file_range``; elsewhere, or when both are unsupported,
+    ``shutil.copy2`` is used. Hardlinks are deliberately avoided: files
+    are rewritten in place, which would silently change the copy too.
+
+    Args:
+        source_file: File to copy
+        target_file: Destination path
+    """
+    import shutil
+
+    if _copy_file_in_kernel(Path(source_file), Path(target_file)):
+        shutil.copystat(source_file, target_file)
+    else:
+        shutil.copy2(source_file, target_file)
+
+
+def _copy_file_in_kernel(source_path: Path, target_path: Path) -> bool:
+    """Try to copy ``source_path`` to a new ``target_path`` without userspace I/O.
+
+    Returns:
+        True if the copy was made, False if a regular copy is needed.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        with open(source_path, "rb") as src, open(target_path, "xb") as dst:
+            try:
+                # Reflink (Btrfs, XFS, ...): no data is copied at all
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return True
+            except OSError:
+                pass
+
+            if hasattr(os, "copy_file_range"):
+                try:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            src.fileno(), dst.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    return True
+                except OSError:
+                    pass
+    except OSError:
+        return False
+
+    # Remove the partial target left behind by the failed attempts
+    try:
+        target_path.unlink()
+    except FileNotFoundError:
+        pass
+    return False
+
+
 def save_yaml_file(
     data: Dict, file_path: str, header_comment: Optional[str] = None
 ) -> None:
@@ -640,13 +1104,17 @@ def save_yaml_file(
         path_obj.parent.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Ensuring directory exists: {path_obj.parent}")
 
-        # Write YAML file
-        with open(path_obj, "w", encoding="utf-8") as f:
-            f.write("---\n")
-            if header_comment:
-                f.write(f"# {header_comment}\n")
-                f.write("\n")
-            yaml.dump(data, f, default_flow_style=False, sort_keys=True)
+        # Serialize first so a dump error never truncates an existing file
+        parts = ["---\n"]
+        if header_comment:
+            parts.append(f"# {header_comment}\n\n")
+        parts.append(
+            yaml.dump(
+                data, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=True
+            )
+        )
+
+        path_obj.write_bytes("".join(parts).encode("utf-8"))
 
         logger.info(f"Successfully saved YAML file: {file_path}")
 
@@ -658,6 +1126,48 @@ def save_yaml_file(
         raise yaml.YAMLError(f"Invalid YAML data: {e}") from e
 
 
+def save_structured_file(
+    data: Dict, file_path: str, header_comment: Optional[str] = None
+) -> None:
+    """Save data as JSON or YAML depending on the file suffix.
+
+    ``.json`` files are written with the standard library JSON encoder,
+    which is much faster than YAML emission for large data. Every other
+    suffix is delegated to :func:`save_yaml_file`. JSON has no comment
+    syntax, so ``header_comment`` only applies to YAML output.
+
+    Args:
+        data: Data to save
+        file_path: Path to save file
+        header_comment: Optional header comment (YAML only)
+
+    Raises:
+        OSError: If file cannot be written
+        ValueError: If data cannot be serialized to JSON
+        yaml.YAMLError: If data cannot be serialized to YAML
+    """
+    path_obj = Path(file_path)
+    if path_obj.suffix.lower() != ".json":
+        save_yaml_file(data, file_path, header_comment)
+        return
+
+    logger = get_logger(__name__)
+
+    try:
+        path_obj.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+        path_obj.write_bytes((payload + "\n").encode("utf-8"))
+
+        logger.info(f"Successfully saved JSON file: {file_path}")
+
+    except OSError as e:
+        logger.error(f"Failed to write JSON file {file_path}: {e}")
+        raise OSError(f"Cannot write to {file_path}: {e}") from e
+    except (TypeError, ValueError) as e:
+        logger.error(f"Failed to serialize data to JSON: {e}")
+        raise ValueError(f"Invalid JSON data: {e}") from e
+
+
 def load_yaml_file(file_path: str) -> Optional[Dict[str, Any]]:
     """Load data from a YAML file with comprehensive error handling.
 
@@ -684,7 +1194,7 @@ def load_yaml_file(file_path: str) -> Optional[Dict[str, Any]]:
         # Try to read and parse the file with file locking
         try:
             with file_lock(path_obj, "r", timeout=10, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YAML_LOADER)
 
                 # Ensure we return a dict or None
                 if data is None:
@@ -828,53 +1338,60 @@ def validate_csv_headers(
 
     try:
         with csv_file.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            actual_headers = reader.fieldnames or []
-
-            # Check for missing required headers
-            missing_headers = set(expected_headers) - set(actual_headers)
-            if missing_headers:
-                result.add_error(
-                    f"Missing required headers: {', '.join(sorted(missing_headers))}"
-                )
+            actual_headers = next(csv.reader(f), [])
+    except Exception as e:
+        result.add_error(f"Error reading CSV file: {e}")
+        return result
 
-            # Check for unexpected headers (warnings)
-            unexpected_headers = set(actual_headers) - set(expected_headers)
-            if unexpected_headers:
-                unexpected_list = ", ".join(sorted(unexpected_headers))
-                result.add_warning(
-                    f"Unexpected headers (will be ignored): {unexpected_list}"
-                )
+    _check_csv_headers(actual_headers, expected_headers, result)
+    return result
 
-            # Check for case-insensitive matches
-            actual_lower = {h.lower(): h for h in actual_headers}
-
-            case_mismatches = []
-            for expected in expected_headers:
-                if (
-                    expected.lower() in actual_lower
-                    and expected != actual_lower[expected.lower()]
-                ):
-                    case_mismatches.append(
-                        f"'{expected}' vs '{actual_lower[expected.lower()]}'"
-                    )
 
-            if case_mismatches:
-                result.add_warning(
-                    f"Case mismatches found: {', '.join(case_mismatches)}"
-                )
+def _check_csv_headers(
+    actual_headers: Sequence[str],
+    expected_headers: List[str],
+    result: ValidationResult,
+) -> None:
+    """Record header problems for ``actual_headers`` on ``result``."""
+    # Check for missing required headers
+    missing_headers = set(expected_headers) - set(actual_headers)
+    if missing_headers:
+        result.add_error(
+            f"Missing required headers: {', '.join(sorted(missing_headers))}"
+        )
 
-    except Exception as e:
-        result.add_error(f"Error reading CSV file: {e}")
+    # Check for unexpected headers (warnings)
+    unexpected_headers = set(actual_headers) - set(expected_headers)
+    if unexpected_headers:
+        unexpected_list = ", ".join(sorted(unexpected_headers))
+        result.add_warning(f"Unexpected headers (will be ignored): {unexpected_list}")
 
-    return result
+    # Check for case-insensitive matches
+    actual_lower = {h.lower(): h for h in actual_headers}
+
+    case_mismatches = []
+    for expected in expected_headers:
+        if (
+            expected.lower() in actual_lower
+            and expected != actual_lower[expected.lower()]
+        ):
+            case_mismatches.append(
+                f"'{expected}' vs '{actual_lower[expected.lower()]}'"
+            )
 
+    if case_mismatches:
+        result.add_warning(f"Case mismatches found: {', '.join(case_mismatches)}")
 
-def validate_csv_structure(csv_file: Path) -> ValidationResult:
+
+def validate_csv_structure(
+    csv_file: Path, headers_only: bool = False
+) -> ValidationResult:
     """Perform comprehensive CSV validation.
 
     Args:
         csv_file: Path to the CSV file to validate.
+        headers_only: Only check the header row and skip building a Host
+            for every data row.
 
     Returns:
         ValidationResult with detailed validation results.
@@ -887,53 +1404,65 @@ def validate_csv_structure(csv_file: Path) -> ValidationResult:
     # Expected headers from configuration
     expected_headers = get_csv_template_headers()
 
-    # Validate headers first
-    header_validation = validate_csv_headers(csv_file, expected_headers)
-    result.errors.extend(header_validation.errors)
-    result.warnings.extend(header_validation.warnings)
+    # Header checks, row validation and duplicate detection share one scan
+    try:
+        fieldnames, rows = _scan_csv_file(csv_file)
+    except Exception as e:
+        result.add_error(f"Error reading CSV file: {e}")
+        return result
+
+    _check_csv_headers(fieldnames, expected_headers, result)
 
-    if not result.is_valid:
+    if headers_only or not result.is_valid:
         return result
 
     # Validate data rows
     try:
-        with csv_file.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        row_errors = []
+        seen_hostnames: Set[str] = set()
+        valid_rows = 0
+        total_rows = 0
+
+        # Read the hostname straight from the record so that comment and
+        # duplicate rows are rejected before a row dict is built
+        positions = {name: i for i, name in enumerate(fieldnames)}
+        hostname_idx = positions.get("hostname")
+
+        for row_num, record in enumerate(rows, start=2):
+            total_rows += 1
+            hostname = ""
+            if hostname_idx is not None and hostname_idx < len(record):
+                hostname = record[hostname_idx].strip()
+
+            # Skip empty rows and comments
+            if not hostname or hostname.startswith("#"):
+                continue
+
+            if hostname in seen_hostnames:
+                row_errors.append(f"Row {row_num} ({hostname}): Duplicate hostname")
+                continue
+            seen_hostnames.add(hostname)
 
-            row_errors = []
-            valid_rows = 0
-            total_rows = 0
-
-            for row_num, row in enumerate(reader, start=2):
-                total_rows += 1
-                hostname = row.get("hostname", "").strip()
-
-                # Skip empty rows and comments
-                if not hostname or hostname.startswith("#"):
-                    continue
-
-                try:
-                    # Try to create Host object (this validates all fields)
-                    Host.from_csv_row(row)
-                    valid_rows += 1
-                except ValueError as e:
-                    row_errors.append(f"Row {row_num} ({hostname}): {e}")
-                except Exception as e:
-                    row_errors.append(
-                        f"Row {row_num} ({hostname}): Unexpected error - {e}"
-                    )
-
-            # Add summary
-            if row_errors:
-                result.errors.extend(row_errors)
-                result.add_error(
-                    f"CSV validation failed: {len(row_errors)} invalid rows "
-                    f"out of {total_rows} total rows"
-                )
-            else:
-                result.add_warning(
-                    f"CSV validation passed: {valid_rows} valid rows processed"
-                )
+            try:
+                # Try to create Host object (this validates all fields)
+                Host.from_csv_row(_clean_csv_row(fieldnames, record))
+                valid_rows += 1
+            except ValueError as e:
+                row_errors.append(f"Row {row_num} ({hostname}): {e}")
+            except Exception as e:
+                row_errors.append(f"Row {row_num} ({hostname}): Unexpected error - {e}")
+
+        # Add summary
+        if row_errors:
+            result.errors.extend(row_errors)
+            result.add_error(
+                f"CSV validation failed: {len(row_errors)} invalid rows "
+                f"out of {total_rows} total rows"
+            )
+        else:
+            result.add_warning(
+                f"CSV validation passed: {valid_rows} valid rows processed"
+            )
 
     except Exception as e:
         result.add_error(f"Error reading CSV file: {e}")
@@ -941,9 +1470,13 @@ def validate_csv_structure(csv_file: Path) -> ValidationResult:
     return result
 
 
+@lru_cache(maxsize=None)
 def get_csv_template() -> str:
     """Get a CSV template with all required headers and example data.
 
+    The template only depends on configuration loaded at import time, so
+    it is built once and reused.
+
     Headers are loaded from configuration and organized logically:
     - Required fields first (hostname, environment, status)
     - Identity fields (cname, instance)
@@ -1341,8 +1874,6 @@ def validate_yaml_config(
             and isinstance(data, str)
             and "pattern" in field_schema
         ):
-            import re
-
             if not re.match(field_schema["pattern"], data):
                 errors.append(f"Field {field_path} does not match required pattern")
 
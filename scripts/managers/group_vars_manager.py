@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 from typing import Any, List, Optional
@@ -46,30 +47,42 @@ class GroupVarsManager:
             if host.batch_number:
                 required_group_names.add(f"batch_{host.batch_number}.yml")
 
-        orphaned_count = 0
-        for file_path in self.group_vars_dir.glob("*.yml"):
-            file_name = file_path.name
+        # List the directory once; entries carry their type, so no per-file stat
+        yml_names = set()
+        subdir_names = set()
+        try:
+            with os.scandir(self.group_vars_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdir_names.add(entry.name)
+                    elif entry.name.endswith(".yml"):
+                        yml_names.add(entry.name)
+        except FileNotFoundError:
+            pass
 
-            if file_name in self.protected_files:
-                self.logger.debug(
-                    f"Skipping protected group_vars file during cleanup: {file_path}"
-                )
-                continue
+        protected_names = frozenset(self.protected_files)
+        for file_name in sorted(yml_names & protected_names):
+            self.logger.debug(
+                "Skipping protected group_vars file during cleanup: "
+                f"{self.group_vars_dir / file_name}"
+            )
 
-            if file_name not in required_group_names:
-                if dry_run:
-                    self.logger.info(
-                        f"[DRY RUN] Would remove orphaned group_vars: {file_path}"
+        orphaned_count = 0
+        for file_name in sorted(yml_names - protected_names - required_group_names):
+            file_path = self.group_vars_dir / file_name
+            if dry_run:
+                self.logger.info(
+                    f"[DRY RUN] Would remove orphaned group_vars: {file_path}"
+                )
+            else:
+                try:
+                    file_path.unlink()
+                    self.logger.info(f"Removed orphaned group_vars: {file_path}")
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to remove orphaned file {file_path}: {e}"
                     )
-                else:
-                    try:
-                        file_path.unlink()
-                        self.logger.info(f"Removed orphaned group_vars: {file_path}")
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to remove orphaned file {file_path}: {e}"
-                        )
-                orphaned_count += 1
+            orphaned_count += 1
 
         # Clean up old subdirectory structure if it exists (from previous auto-generation)
         for subdir in [
@@ -80,8 +93,8 @@ class GroupVarsManager:
             "functions",
             "templates",
         ]:
-            subdir_path = self.group_vars_dir / subdir
-            if subdir_path.exists() and subdir_path.is_dir():
+            if subdir in subdir_names:
+                subdir_path = self.group_vars_dir / subdir
                 if dry_run:
                     self.logger.info(
                         f"[DRY RUN] Would remove old subdirectory: {subdir_path}"
@@ -8,7 +8,6 @@ cleanup, and host status management.
 
 import csv
 import re
-import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
@@ -18,6 +17,9 @@ from ..core import get_logger  # noqa: E402
 from ..core.config import PROJECT_ROOT  # noqa: E402
 from ..core.models import InventoryConfig  # noqa: E402
 from ..core.utils import (  # noqa: E402
+    clear_csv_cache,
+    copy_file,
+    load_hosts_from_csv,
     log_data_modification,
     log_file_access,
     security_audit_log,
@@ -39,19 +41,16 @@ class HostManager:
         self.logger.info(f"Using CSV source: {self.csv_file}")
 
     def load_hosts_from_csv_raw(self) -> List[Dict[str, Any]]:
-        """Load raw host data for lifecycle operations."""
-        hosts: List[Dict[str, Any]] = []
-        with self.csv_file.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            # Check if CSV has headers
-            if not reader.fieldnames:
-                self.logger.error("CSV file has no headers or is empty")
-                return hosts
-
-            for row in reader:
-                hostname = row.get("hostname", "").strip()
-                if hostname and not hostname.startswith("#"):
-                    hosts.append(row)
+        """Load raw host data for lifecycle operations.
+
+        The rows are written back by ``save_hosts_to_csv``, so the parse cache
+        is dropped first: a rewrite that keeps the size and lands within the
+        same mtime tick would otherwise return stale rows.
+        """
+        clear_csv_cache()
+        hosts: List[Dict[str, Any]] = load_hosts_from_csv(str(self.csv_file))
+        if not hosts and self.csv_file.stat().st_size == 0:
+            self.logger.error("CSV file has no headers or is empty")
         return hosts
 
     def save_hosts_to_csv(self, hosts: List[Dict]) -> None:
@@ -65,7 +64,7 @@ class HostManager:
                 backup_dir
                 / f"hosts_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             )
-            shutil.copy2(self.csv_file, backup_file)
+            copy_file(str(self.csv_file), str(backup_file))
             self.logger.info(f"Created backup: {backup_file}")
             # Don't write empty file - raise an error instead
             raise ValueError(
@@ -79,17 +78,15 @@ class HostManager:
         backup_file = (
             backup_dir / f"hosts_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
-        shutil.copy2(self.csv_file, backup_file)
+        copy_file(str(self.csv_file), str(backup_file))
         self.logger.info(f"Created backup: {backup_file}")
 
         # Get original fieldnames from the current CSV to preserve order and any custom fields
         original_fieldnames: List[str] = []
         try:
-            with self.csv_file.open("r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                original_fieldnames = (
-                    list(reader.fieldnames) if reader.fieldnames else []
-                )
+            with self.csv_file.open("r", encoding="utf-8", newline="") as f:
+                # Only the header row is needed
+                original_fieldnames = next(csv.reader(f), [])
         except (OSError, IOError) as e:
             self.logger.warning(
                 f"Could not read original fieldnames from {self.csv_file}: {e}"
@@ -118,6 +115,7 @@ class HostManager:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(hosts)
+        clear_csv_cache()
 
         log_data_modification(str(self.csv_file), "UPDATE", len(hosts))
         log_file_access(self.csv_file, "WRITE", success=True)
@@ -6,6 +6,10 @@ Handles the generation of Ansible inventory files and host_vars
 from CSV data sources.
 """
 
+import dataclasses
+import json
+import os
+import sys
 import time
 from collections import defaultdict
 from datetime import datetime
@@ -14,6 +18,11 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from blake3 import blake3 as _content_hash
+except ImportError:  # pragma: no cover - optional dependency
+    from hashlib import sha256 as _content_hash
+
 from ..core import CSV_FILE as DEFAULT_CSV_FILE
 from ..core import (
     HOST_VARS_HEADER,
@@ -21,10 +30,19 @@ from ..core import (
     get_logger,
     load_csv_data,
 )
-from ..core.config import get_environment_info_from_code, load_config
+from ..core._io import read_all, write_all
+from ..core.config import VERSION, get_environment_info_from_code, load_config
+from ..core.utils import YAML_DUMPER
 from ..core.models import Host, InventoryConfig, InventoryStats
 from .group_vars_manager import GroupVarsManager
 
+# Sidecar in the inventory directory remembering the last generation
+GENERATION_CACHE_FILE = ".inv_cache.json"
+
+# Bump whenever the generated files change for the same input, so that
+# results cached by an older generator are not reused
+GENERATION_FORMAT = 1
+
 
 class InventoryManager:
     """Manages core inventory operations and file generation."""
@@ -34,9 +52,18 @@ class InventoryManager:
         csv_file: Optional[Path] = None,
         logger: Optional[Any] = None,
         inventory_key: str = "hostname",
+        config: Optional[InventoryConfig] = None,
     ) -> None:
-        """Initialise the manager with configuration and logging."""
-        self.config = InventoryConfig.create_default(inventory_key=inventory_key)
+        """Initialise the manager with configuration and logging.
+
+        ``config`` lets callers share one immutable configuration between
+        managers; ``inventory_key`` is ignored when it is given.
+        """
+        self.config = (
+            config
+            if config is not None
+            else InventoryConfig.create_default(inventory_key=inventory_key)
+        )
         self.csv_file: Path = csv_file if csv_file is not None else DEFAULT_CSV_FILE
         self.logger = logger if logger else get_logger(__name__)
         self.stats = InventoryStats()
@@ -75,18 +102,30 @@ class InventoryManager:
                 f"Normalized environment filter '{environment}' to '{normalized_env}'"
             )
 
+        # Only a handful of distinct environment codes appear across all rows;
+        # resolve each one once to the environment name it stands for
+        env_names: Dict[str, str] = {}
+
         for row_data in csv_data:
             try:
                 # Map environment code to full name if needed
                 env_code = row_data.get("environment", "").strip()
                 if env_code:
-                    env_info = get_environment_info_from_code(env_code)
-                    if env_info:
-                        # Replace the environment code with the full name
-                        row_data["environment"] = env_info["name"]
-                        self.logger.debug(
-                            f"Mapped environment code '{env_code}' to '{env_info['name']}'"
+                    env_name = env_names.get(env_code)
+                    if env_name is None:
+                        env_info = get_environment_info_from_code(env_code)
+                        env_name = env_names[env_code] = (
+                            env_info["name"] if env_info else env_code
                         )
+                        if env_info:
+                            self.logger.debug(
+                                f"Mapped environment code '{env_code}' "
+                                f"to '{env_name}'"
+                            )
+                    # Rows outside the requested environment never become hosts
+                    if normalized_env and env_name != normalized_env:
+                        continue
+                    row_data["environment"] = env_name
 
                 host = Host.from_csv_row(row_data)
                 if normalized_env and host.environment != normalized_env:
@@ -163,9 +202,20 @@ class InventoryManager:
         return removed_count
 
     def generate_inventories(
-        self, environments: Optional[List[str]] = None, dry_run: bool = False
+        self,
+        environments: Optional[List[str]] = None,
+        dry_run: bool = False,
+        force: bool = False,
     ) -> Dict[str, Any]:
-        """Generate inventory files for specified environments."""
+        """Generate inventory files for specified environments.
+
+        When the CSV source and effective configuration are unchanged since
+        the last successful run for the same environments, and the inventory,
+        host_vars and group_vars files are exactly as that run left them, the
+        previous result is returned without regenerating anything, with
+        ``cached`` set and the timing and cleanup counts of this run. Pass
+        ``force=True`` to always regenerate.
+        """
         self.logger.info("Starting inventory generation")
         start_time = time.time()
 
@@ -173,6 +223,27 @@ class InventoryManager:
         self.stats = InventoryStats()
 
         try:
+            cache_key = None
+            if not dry_run:
+                cache_key = self._generation_cache_key(environments)
+                cached = None if force else self._load_cached_generation(cache_key)
+                if cached is not None:
+                    self.logger.info(
+                        "CSV source unchanged since last generation; "
+                        "reusing previous result"
+                    )
+                    # Nothing was generated or cleaned up on this run
+                    self.stats = InventoryStats(**cached["stats"])
+                    self.stats.generation_time = time.time() - start_time
+                    self.stats.orphaned_files_removed = 0
+                    return {
+                        **cached,
+                        "stats": self.stats.__dict__,
+                        "orphaned_files_removed": 0,
+                        "group_orphaned_removed": 0,
+                        "cached": True,
+                    }
+
             # Load and validate hosts
             hosts = self.load_hosts()
             if not hosts:
@@ -194,8 +265,15 @@ class InventoryManager:
             # Filter environments if specified
             target_environments = environments or self.config.environments
 
+            # Bucket hosts by environment in one pass instead of filtering
+            # the full host list once per environment
+            hosts_by_env: Dict[str, List[Host]] = defaultdict(list)
+            for host in hosts:
+                hosts_by_env[host.environment].append(host)
+
             # Generate inventories for each environment
             generated_files = []
+            failed = False
 
             for env in target_environments:
                 # Map abbreviation to full name and filename if needed
@@ -206,48 +284,48 @@ class InventoryManager:
                 else:
                     env_name = env
                     inventory_filename = f"{env}.yml"
-                try:
-                    self.logger.info(f"Processing environment: {env_name}")
-                    env_hosts = [
-                        h
-                        for h in hosts
-                        if h.environment == env or h.environment == env_name
-                    ]
-
-                    if not env_hosts:
-                        self.logger.warning(
-                            f"No hosts found for environment: {env_name}"
-                        )
-                        continue
 
-                    if dry_run:
-                        self.logger.info(
-                            f"[DRY RUN] Would generate inventory for {env_name} "
-                            f"with {len(env_hosts)} hosts"
-                        )
-                    else:
-                        # Generate the actual inventory file
-                        inventory_file = self._generate_inventory_file(
-                            env_name, env_hosts, inventory_filename
-                        )
-                        generated_files.append(str(inventory_file))
-                        self.logger.info(f"Generated inventory file: {inventory_file}")
+                self.logger.info(f"Processing environment: {env_name}")
+                env_hosts = hosts_by_env.get(env_name, [])
+                if env != env_name and env in hosts_by_env:
+                    # Hosts still carrying the code rather than the full name
+                    env_hosts = env_hosts + hosts_by_env[env]
+
+                if not env_hosts:
+                    self.logger.warning(f"No hosts found for environment: {env_name}")
+                    continue
 
+                if dry_run:
+                    self.logger.info(
+                        f"[DRY RUN] Would generate inventory for {env_name} "
+                        f"with {len(env_hosts)} hosts"
+                    )
+                    continue
+
+                try:
+                    # Generate the actual inventory file
+                    inventory_file = self._generate_inventory_file(
+                        env_name, env_hosts, inventory_filename
+                    )
                 except Exception as e:
                     self.logger.error(
                         f"Failed to generate inventory for {env_name}: {e}",
                         exc_info=True,
                     )
+                    failed = True
                     # Continue with other environments
                     continue
 
+                generated_files.append(str(inventory_file))
+                self.logger.info(f"Generated inventory file: {inventory_file}")
+
             # Calculate generation time
             self.stats.generation_time = time.time() - start_time
 
             # Add orphaned count to stats
             self.stats.orphaned_files_removed = orphaned_count
 
-            return {
+            result = {
                 "generated_files": generated_files,
                 "dry_run": dry_run,
                 "stats": self.stats.__dict__,
@@ -255,8 +333,14 @@ class InventoryManager:
                 "orphaned_files_removed": orphaned_count,
                 "group_vars_created": 0,  # TODO: Implement group vars creation tracking
                 "group_orphaned_removed": group_orphaned_removed,
+                "cached": False,
             }
 
+            if cache_key is not None and not failed:
+                self._save_cached_generation(cache_key, result)
+
+            return result
+
         except FileNotFoundError as e:
             self.logger.error(f"CSV source file not found: {e}")
             raise
@@ -264,6 +348,91 @@ class InventoryManager:
             self.logger.error(f"Inventory generation failed: {e}", exc_info=True)
             raise ValueError(f"Failed to generate inventories: {e}") from e
 
+    def _generation_cache_key(self, environments: Optional[List[str]]) -> str:
+        """Identify a generation run by its inputs.
+
+        Covers the generator version and output format, the CSV contents,
+        the effective configuration (config file, defaults and environment
+        variable overrides), the manager configuration and the requested
+        environments.
+        """
+        digest = _content_hash(read_all(self.csv_file))
+        digest.update(
+            json.dumps(
+                [
+                    VERSION,
+                    GENERATION_FORMAT,
+                    load_config(),
+                    dataclasses.asdict(self.config),
+                    environments or self.config.environments,
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        )
+        return str(digest.hexdigest())
+
+    def _generation_output_state(
+        self, generated_files: List[str]
+    ) -> Dict[str, List[int]]:
+        """Return ``[mtime_ns, size]`` for every file a generation run owns.
+
+        Covers the inventory files plus everything below the host_vars and
+        group_vars directories, so added, removed or edited files all show up
+        as a difference.
+
+        Raises:
+            OSError: If one of ``generated_files`` cannot be stat'ed.
+        """
+        state: Dict[str, List[int]] = {}
+        for path in generated_files:
+            st = os.stat(path)
+            state[path] = [st.st_mtime_ns, st.st_size]
+
+        # GroupVarsManager takes its directory from the loaded configuration
+        paths = load_config().get("paths", {})
+        output_dirs = {
+            os.path.abspath(directory)
+            for directory in (
+                self.config.host_vars_dir,
+                self.config.group_vars_dir,
+                paths.get("group_vars", self.config.group_vars_dir),
+            )
+        }
+        for directory in sorted(output_dirs):
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    path = os.path.join(root, name)
+                    st = os.stat(path)
+                    state[path] = [st.st_mtime_ns, st.st_size]
+        return state
+
+    def _load_cached_generation(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``cache_key`` if its outputs are intact."""
+        cache_file = self.config.inventory_dir / GENERATION_CACHE_FILE
+        try:
+            cache = json.loads(cache_file.read_bytes())
+            if cache.get("key") != cache_key:
+                return None
+            result = cache["result"]
+            if cache["files"] != self._generation_output_state(
+                result["generated_files"]
+            ):
+                return None
+            return result  # type: ignore[no-any-return]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def _save_cached_generation(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Remember ``result`` together with the state of the files it owns."""
+        cache_file = self.config.inventory_dir / GENERATION_CACHE_FILE
+        try:
+            files = self._generation_output_state(result["generated_files"])
+            cache = {"key": cache_key, "files": files, "result": result}
+            cache_file.write_text(json.dumps(cache), encoding="utf-8")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write generation cache {cache_file}: {e}")
+
     def create_host_vars(self, host: Host, host_vars_dir: Path) -> None:
         """Create host_vars file for a host.
 
@@ -329,115 +498,115 @@ class InventoryManager:
             if key not in all_configured_fields:
                 host_vars[key] = value
 
-        # Generate the new YAML content
-        import io
-
-        yaml_buffer = io.StringIO()
-        yaml.dump(host_vars, yaml_buffer, default_flow_style=False, sort_keys=True)
-        new_yaml_content = yaml_buffer.getvalue()
+        # Generate the complete new file content
+        new_yaml_content = yaml.dump(
+            host_vars,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=True,
+        )
+        payload = (
+            f"---\n# Host variables for {primary_id}\n# {HOST_VARS_HEADER}\n\n"
+            f"{new_yaml_content}"
+        ).encode("utf-8")
 
         # Use the inventory key-based filename
         host_vars_filename = host.get_host_vars_filename(self.config.inventory_key)
         host_vars_file: Path = host_vars_dir / host_vars_filename
 
-        # Check if file exists and compare content
+        # Compare against the existing file; the header is deterministic
         should_write = True
-        if host_vars_file.exists():
-            try:
-                with host_vars_file.open("r", encoding="utf-8") as f:
-                    existing_lines = f.readlines()
-
-                # Extract existing YAML content (skip header lines)
-                yaml_start_index = None
-                for i, line in enumerate(existing_lines):
-                    if line.strip() == "" and i > 0:
-                        yaml_start_index = i + 1
-                        break
-
-                if yaml_start_index is not None:
-                    existing_yaml_content = "".join(existing_lines[yaml_start_index:])
-                    should_write = existing_yaml_content != new_yaml_content
-                    if not should_write:
-                        self.logger.debug(
-                            f"Content unchanged for {host_vars_filename}, skipping write"
-                        )
-
-            except Exception as e:
+        try:
+            should_write = read_all(host_vars_file) != payload
+            if not should_write:
                 self.logger.debug(
-                    f"Could not read existing host_vars file {host_vars_file}: {e}"
+                    f"Content unchanged for {host_vars_filename}, skipping write"
                 )
-                should_write = True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug(
+                f"Could not read existing host_vars file {host_vars_file}: {e}"
+            )
 
         # Only write if content has changed or file doesn't exist
         if should_write:
-            with host_vars_file.open("w", encoding="utf-8") as f:
-                f.write("---\n")
-                f.write(f"# Host variables for {primary_id}\n")
-                f.write(f"# {HOST_VARS_HEADER}\n")
-                f.write("\n")
-                f.write(new_yaml_content)
+            write_all(host_vars_file, payload)
             self.logger.debug(f"Updated host_vars file: {host_vars_filename}")
 
     def build_environment_inventory(
         self, hosts: List[Host], environment: str
     ) -> Dict[str, Any]:
-        """Build inventory dictionary for an environment."""
-        inventory: Dict[str, Any] = defaultdict(lambda: {"hosts": {}, "children": {}})
+        """Build inventory dictionary for an environment.
 
-        # Add 'all' group as the top-level parent
-        inventory["all"] = {"children": {}}
+        Groups are created on first use and looked up through local
+        references, and site group names are built once per distinct site
+        code, so the per-host work is a handful of dict insertions.
+        """
+        inventory: Dict[str, Any] = {"all": {"children": {}}}
+        inventory_key = self.config.inventory_key
+        env_group_name = sys.intern(f"env_{environment}")
+        env_hosts: Optional[Dict[str, Any]] = None
+        env_children: Dict[str, Any] = {}
+        site_groups: Dict[str, str] = {}
+
+        def group(name: str) -> Dict[str, Any]:
+            data = inventory.get(name)
+            if data is None:
+                data = inventory[name] = {"hosts": {}, "children": {}}
+            return data  # type: ignore[no-any-return]
 
         for host in hosts:
             if host.environment != environment:
                 continue
-            host_key = host.get_inventory_key_value(self.config.inventory_key)
+            host_key = host.get_inventory_key_value(inventory_key)
 
             # Ensure environment group exists and is a child of 'all'
-            env_group_name = f"env_{environment}"
-            if env_group_name not in inventory:
-                inventory[env_group_name] = {"hosts": {}, "children": {}}
-            inventory["all"]["children"][env_group_name] = {}
+            if env_hosts is None:
+                env_group = group(env_group_name)
+                env_hosts, env_children = env_group["hosts"], env_group["children"]
+                inventory["all"]["children"][env_group_name] = {}
 
             # Add host to environment group
-            inventory[env_group_name]["hosts"][host_key] = {}
+            env_hosts[host_key] = {}
 
             # Add application service group as child of environment group
             if host.application_service:
                 app_group = host.get_app_group_name()
                 if app_group:
-                    if app_group not in inventory:
-                        inventory[app_group] = {"hosts": {}, "children": {}}
-                    inventory[env_group_name]["children"][app_group] = {}
-                    inventory[app_group]["hosts"][host_key] = {}
+                    app_data = group(app_group)
+                    env_children[app_group] = {}
+                    app_data["hosts"][host_key] = {}
 
                     # Add product groups as children of application group
-                    if host.get_product_ids():
+                    if host.products:
+                        app_children = app_data["children"]
                         for prod_group in host.get_product_group_names():
-                            if prod_group not in inventory:
-                                inventory[prod_group] = {"hosts": {}, "children": {}}
-                            inventory[app_group]["children"][prod_group] = {}
-                            inventory[prod_group]["hosts"][host_key] = {}
+                            app_children[prod_group] = {}
+                            group(prod_group)["hosts"][host_key] = {}
 
             # Add site_code group if available (as child of environment group)
             if host.site_code:
-                site_code_str = str(host.site_code).strip()
-                if site_code_str:
-                    site_group = f"site_{site_code_str.lower().replace('-', '_')}"
-                    if site_group not in inventory:
-                        inventory[site_group] = {"hosts": {}, "children": {}}
-                    inventory[env_group_name]["children"][site_group] = {}
-                    inventory[site_group]["hosts"][host_key] = {}
+                site_group = site_groups.get(host.site_code)
+                if site_group is None:
+                    site_code_str = str(host.site_code).strip()
+                    site_group = site_groups[host.site_code] = (
+                        sys.intern(f"site_{site_code_str.lower().replace('-', '_')}")
+                        if site_code_str
+                        else ""
+                    )
+                if site_group:
+                    env_children[site_group] = {}
+                    group(site_group)["hosts"][host_key] = {}
 
             # Add batch_number group if available (as child of environment group)
             if host.batch_number:
                 batch_group = host.get_batch_group_name()
                 if batch_group:
-                    if batch_group not in inventory:
-                        inventory[batch_group] = {"hosts": {}, "children": {}}
-                    inventory[env_group_name]["children"][batch_group] = {}
-                    inventory[batch_group]["hosts"][host_key] = {}
+                    env_children[batch_group] = {}
+                    group(batch_group)["hosts"][host_key] = {}
 
-        return dict(inventory)
+        return inventory
 
     def write_inventory_file(
         self, inventory: Dict[str, Any], output_file: Path, title: str
@@ -461,7 +630,11 @@ class InventoryManager:
 
         yaml_buffer = io.StringIO()
         yaml.dump(
-            filtered_inventory, yaml_buffer, default_flow_style=False, sort_keys=True
+            filtered_inventory,
+            yaml_buffer,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=True,
         )
         new_yaml_content = yaml_buffer.getvalue()
 
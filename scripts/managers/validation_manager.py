@@ -8,6 +8,7 @@ and health monitoring with scoring and recommendations.
 
 import shutil
 import subprocess
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -16,6 +17,7 @@ import yaml
 from ..core import get_logger  # noqa: E402
 from ..core.config import CSV_FILE  # noqa: E402
 from ..core.models import InventoryConfig, ValidationResult  # noqa: E402
+from ..core.utils import YAML_LOADER  # noqa: E402
 from .inventory_manager import InventoryManager  # noqa: E402
 
 
@@ -64,7 +66,7 @@ class ValidationManager:
             else:
                 try:
                     with env_file.open("r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YAML_LOADER)
                         if not data:
                             validation.add_warning(f"env_{env}.yml is empty")
                 except Exception as e:
@@ -171,8 +173,8 @@ class ValidationManager:
             hosts = self.inventory_manager.load_hosts()
 
             # Check for duplicate hostnames
-            hostnames = [host.hostname for host in hosts if host.hostname]
-            duplicates = {name for name in hostnames if hostnames.count(name) > 1}
+            hostname_counts = Counter(host.hostname for host in hosts if host.hostname)
+            duplicates = [name for name, count in hostname_counts.items() if count > 1]
             if duplicates:
                 validation.add_error(
                     f"Duplicate hostnames found: {', '.join(duplicates)}"
@@ -264,7 +266,7 @@ class ValidationManager:
                     # Validate YAML syntax
                     try:
                         with host_var_file.open("r", encoding="utf-8") as f:
-                            yaml.safe_load(f)
+                            yaml.load(f, Loader=YAML_LOADER)
                     except yaml.YAMLError as e:
                         validation.add_error(
                             f"YAML error in {inventory_key_value}.yml: {e}"
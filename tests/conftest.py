@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 """Pytest configuration and shared fixtures for all tests."""
 
-import csv
+import dataclasses
+import sys
 import tempfile
+from collections.abc import Mapping
+from itertools import cycle, repeat
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+import yaml
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_data():
     """Provide sample CSV data for testing."""
     return """hostname,environment,status,application_service,product_1,product_2,site_code,batch_number
@@ -27,7 +31,7 @@ test-api-01,test,active,api_server,api,logging,use1,2
 acc-web-01,acceptance,active,web_server,web,monitoring,use1,1"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_csv_data():
     """Provide minimal CSV data for testing."""
     return """hostname,environment,status
@@ -35,7 +39,7 @@ test-host,production,active
 test-host-2,development,active"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_csv_data():
     """Provide invalid CSV data for testing."""
     return """hostname,environment,status
@@ -44,27 +48,45 @@ test-host,production,active
 invalid-host,invalid_env,active"""
 
 
+@pytest.fixture(scope="session")
+def _sample_csv_bytes(sample_csv_data):
+    """Encode the sample CSV payload once per session."""
+    return sample_csv_data.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def _minimal_csv_bytes(minimal_csv_data):
+    """Encode the minimal CSV payload once per session."""
+    return minimal_csv_data.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def _invalid_csv_bytes(invalid_csv_data):
+    """Encode the invalid CSV payload once per session."""
+    return invalid_csv_data.encode("utf-8")
+
+
 @pytest.fixture
-def temp_csv_file(tmp_path, sample_csv_data):
+def temp_csv_file(tmp_path, _sample_csv_bytes):
     """Create temporary CSV file with sample data."""
     csv_file = tmp_path / "test_hosts.csv"
-    csv_file.write_text(sample_csv_data)
+    csv_file.write_bytes(_sample_csv_bytes)
     return csv_file
 
 
 @pytest.fixture
-def minimal_csv_file(tmp_path, minimal_csv_data):
+def minimal_csv_file(tmp_path, _minimal_csv_bytes):
     """Create temporary CSV file with minimal data."""
     csv_file = tmp_path / "minimal_hosts.csv"
-    csv_file.write_text(minimal_csv_data)
+    csv_file.write_bytes(_minimal_csv_bytes)
     return csv_file
 
 
 @pytest.fixture
-def invalid_csv_file(tmp_path, invalid_csv_data):
+def invalid_csv_file(tmp_path, _invalid_csv_bytes):
     """Create temporary CSV file with invalid data."""
     csv_file = tmp_path / "invalid_hosts.csv"
-    csv_file.write_text(invalid_csv_data)
+    csv_file.write_bytes(_invalid_csv_bytes)
     return csv_file
 
 
@@ -74,28 +96,213 @@ def large_csv_file(tmp_path):
     csv_file = tmp_path / "large_hosts.csv"
     
     header = "hostname,environment,status,application_service,product_1,product_2,site_code,batch_number"
-    rows = [header]
     
     environments = ["production", "development", "test", "acceptance"]
     applications = ["web_server", "api_server", "database_server", "cache_server"]
     products = ["web", "api", "db", "cache", "monitoring", "logging"]
     sites = ["use1", "usw2", "euw1", "apse1"]
     
-    for i in range(1000):
-        env = environments[i % len(environments)]
-        app = applications[i % len(applications)]
-        product1 = products[i % len(products)]
-        product2 = products[(i + 1) % len(products)]
-        site = sites[i % len(sites)]
-        batch = str((i % 10) + 1)
-        
-        row = f"host-{i:04d},{env},active,{app},{product1},{product2},{site},{batch}"
-        rows.append(row)
+    def rows():
+        for i in range(1000):
+            env = environments[i % len(environments)]
+            app = applications[i % len(applications)]
+            product1 = products[i % len(products)]
+            product2 = products[(i + 1) % len(products)]
+            site = sites[i % len(sites)]
+            batch = str((i % 10) + 1)
+            
+            yield f"host-{i:04d},{env},active,{app},{product1},{product2},{site},{batch}\n"
     
-    csv_file.write_text("\n".join(rows))
+    with csv_file.open("w", newline="", buffering=1 << 20) as f:
+        f.write(header + "\n")
+        f.writelines(rows())
     return csv_file
 
 
+@pytest.fixture(scope="session")
+def shared_inventory_config():
+    """Build the immutable default inventory configuration once per session."""
+    from scripts.core.models import InventoryConfig
+
+    return InventoryConfig.create_default()
+
+
+@pytest.fixture
+def make_manager(shared_inventory_config, tmp_path):
+    """Return a factory creating an InventoryManager with the shared config.
+
+    Generated files and the generation cache go below ``tmp_path`` rather
+    than the repository inventory, so no state is shared between tests.
+    """
+    from scripts.managers.inventory_manager import InventoryManager
+
+    output_dir = tmp_path / "generated"
+    config = dataclasses.replace(
+        shared_inventory_config,
+        inventory_dir=output_dir,
+        host_vars_dir=output_dir / "host_vars",
+        group_vars_dir=output_dir / "group_vars",
+    )
+
+    def _make(csv_file, **kwargs):
+        kwargs.setdefault("config", config)
+        return InventoryManager(csv_file=csv_file, **kwargs)
+
+    return _make
+
+
+def _load_yaml(path):
+    """Parse a YAML file straight from the byte stream with the C loader."""
+    from scripts.core.utils import YAML_LOADER
+
+    with Path(path).open("rb") as fh:
+        return yaml.load(fh, Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="session")
+def load_yaml():
+    """Return a helper that loads a YAML file without decoding it first."""
+    return _load_yaml
+
+
+# Deterministic CSV layouts shared by the performance tests, keyed by schema id.
+# Each entry is (header, column builder taking the row count). Columns are
+# periodic iterators zipped into rows, so no per-row Python code runs for
+# anything but the hostnames.
+_STD_ENVS = ("production", "development")
+_STD_PRODUCTS_2 = ("monitoring", "logging")
+_STD_SITES = ("use1", "usw2")
+_STD_APPS = ("web_server", "api_server", "database_server")
+_STD_PRODUCTS_1 = ("web", "api", "db")
+_MIXED_ENVS = ("production", "development", "test", "acceptance")
+_MIXED_APPS = ("web_server", "api_server", "database_server", "cache_server")
+_MIXED_PRODUCTS = ("web", "api", "db", "cache", "monitoring", "logging")
+_MIXED_SITES = ("use1", "usw2", "euw1", "apse1")
+_FULL_HEADER = (
+    "hostname,environment,status,cname,instance,site_code,ssl_port,application_service"
+    ",product_1,product_2,product_3,product_4,primary_application,function"
+    ",batch_number,patch_mode,dashboard_group,decommission_date"
+)
+
+
+def _hostnames(size, width):
+    return map(f"host-{{:0{width}d}}".format, range(size))
+
+
+def _full_columns(size, width):
+    return (
+        _hostnames(size, width), repeat("production"), repeat("active"),
+        map("host{}.example.com".format, range(size)), range(size),
+        repeat("use1"), repeat(443), repeat("web_server"), repeat("web"),
+        repeat("monitoring"), repeat("analytics"), repeat(""), repeat("nginx"),
+        repeat("load_balancer"), cycle(range(1, 6)), repeat("auto"),
+        repeat("web_servers"), repeat(""),
+    )
+
+
+def _validation_hostnames(size):
+    # Every 100th row duplicates the previous hostname
+    return (f"host-{i - (i % 100 == 0):04d}" for i in range(size))
+
+
+_CSV_SCHEMAS = {
+    "std_8col": (
+        "hostname,environment,status,application_service,product_1,product_2,site_code,batch_number",
+        lambda size: (_hostnames(size, 4), cycle(_STD_ENVS), repeat("active"),
+                      cycle(_STD_APPS), cycle(_STD_PRODUCTS_1), cycle(_STD_PRODUCTS_2),
+                      cycle(_STD_SITES), cycle(range(1, 6))),
+    ),
+    "mixed_8col": (
+        "hostname,environment,status,application_service,product_1,product_2,site_code,batch_number",
+        lambda size: (_hostnames(size, 4), cycle(_MIXED_ENVS), repeat("active"),
+                      cycle(_MIXED_APPS), cycle(_MIXED_PRODUCTS),
+                      cycle(_MIXED_PRODUCTS[1:] + _MIXED_PRODUCTS[:1]),
+                      cycle(_MIXED_SITES), cycle(range(1, 11))),
+    ),
+    "full_18col": (
+        _FULL_HEADER,
+        lambda size: _full_columns(size, 5),
+    ),
+    "wide_38col": (
+        _FULL_HEADER + "".join(f",extra_col_{j}" for j in range(20)),
+        lambda size: _full_columns(size, 4),
+    ),
+    "validation_5col": (
+        "hostname,environment,status,application_service,product_1",
+        lambda size: (
+            _validation_hostnames(size),
+            cycle(_STD_ENVS),
+            cycle(("invalid_status",) + ("active",) * 9),  # 10% invalid
+            cycle(("web_server", "api_server", "api_server")),
+            cycle(("web", "api", "api")),
+        ),
+    ),
+    "basic_4col": (
+        "hostname,environment,status,application_service",
+        lambda size: (_hostnames(size, 5), repeat("production"), repeat("active"),
+                      repeat("web_server")),
+    ),
+    "two_env_5col": (
+        "hostname,environment,status,application_service,product_1",
+        lambda size: (_hostnames(size, 4), cycle(_STD_ENVS), repeat("active"),
+                      repeat("web_server"), repeat("web")),
+    ),
+    "four_env_5col": (
+        "hostname,environment,status,application_service,product_1",
+        lambda size: (_hostnames(size, 5), cycle(_MIXED_ENVS), repeat("active"),
+                      cycle(_STD_APPS), cycle(_STD_PRODUCTS_1)),
+    ),
+    "two_env_6col": (
+        "hostname,environment,status,application_service,product_1,product_2",
+        lambda size: (_hostnames(size, 4), cycle(_STD_ENVS), repeat("active"),
+                      cycle(("web_server", "api_server", "api_server")),
+                      cycle(("web", "api", "api")), cycle(_STD_PRODUCTS_2)),
+    ),
+}
+
+
+def _row_template(header):
+    """Return a ``str.format`` template encoding one row of ``header``'s columns.
+
+    Schema values never contain commas, quotes or newlines, so rows can be
+    formatted directly instead of going through csv.writer's quoting checks.
+    """
+    return ",".join(map("{{{}}}".format, range(header.count(",") + 1))) + "\n"
+
+
+# Row templates for schemas whose trailing columns are derived from others
+_ROW_TEMPLATES = {
+    # The 20 extra values repeat the row index held in the instance column
+    "wide_38col": _row_template(_FULL_HEADER)[:-1]
+    + "".join(f",extra_value_{{4}}_{j}" for j in range(20))
+    + "\n",
+}
+
+
+@pytest.fixture(scope="session")
+def csv_factory(tmp_path_factory):
+    """Return ``make_csv(size, schema_id)``, writing each distinct CSV once.
+
+    Files are shared by every test in the session and must not be modified.
+    """
+    cache_dir = tmp_path_factory.mktemp("csv_cache")
+    cache = {}
+
+    def make_csv(size, schema_id):
+        key = (size, schema_id)
+        if key not in cache:
+            header, build_columns = _CSV_SCHEMAS[schema_id]
+            csv_file = cache_dir / f"{schema_id}_{size}.csv"
+            with csv_file.open("w", newline="", buffering=1 << 20) as f:
+                f.write(header + "\n")
+                template = _ROW_TEMPLATES.get(schema_id) or _row_template(header)
+                f.writelines(map(template.format, *build_columns(size)))
+            cache[key] = csv_file
+        return cache[key]
+
+    return make_csv
+
+
 @pytest.fixture
 def temp_inventory_dir(tmp_path):
     """Create temporary inventory directory structure."""
@@ -224,45 +431,83 @@ def sample_inventory_data():
     }
 
 
-@pytest.fixture
-def performance_test_data():
-    """Provide performance test data."""
-    return {
-        "small_dataset": 100,
-        "medium_dataset": 1000,
-        "large_dataset": 5000,
-        "csv_loading_threshold": 30.0,
-        "inventory_generation_threshold": 60.0,
-        "memory_usage_threshold": 200.0
-    }
-
-
-@pytest.fixture
-def security_test_data():
-    """Provide security test data."""
-    return {
-        "malicious_csv": """hostname,environment,status,description
+def _build_malicious_csv():
+    """Build CSV payload with injection attempts in a data column."""
+    return """hostname,environment,status,description
 injection-host,production,active,"'; DROP TABLE hosts; --"
 script-host,production,active,"<script>alert('xss')</script>"
 path-host,production,active,"../../../etc/passwd"
 command-host,production,active,"$(rm -rf /)"
 null-host,production,active,"\x00\x01\x02"
 unicode-host,production,active,"🚨💀🔥"
-""",
-        "malicious_headers": """=cmd|'/c calc'!A0,environment,status,application_service
+"""
+
+
+def _build_malicious_headers():
+    """Build CSV payload with formula injection in the header row."""
+    return """=cmd|'/c calc'!A0,environment,status,application_service
 @SUM(1+1)*cmd|'/c calc'!A0,production,active,web_server
 +cmd|'/c calc'!A0,production,active,api_server
--cmd|'/c calc'!A0,production,active,database_server""",
-        "path_traversal_csv": """hostname,environment,status,config_file
+-cmd|'/c calc'!A0,production,active,database_server"""
+
+
+def _build_path_traversal_csv():
+    """Build CSV payload with path traversal attempts."""
+    return """hostname,environment,status,config_file
 normal-host,production,active,/etc/nginx/nginx.conf
 traversal-host,production,active,../../../etc/passwd
 windows-traversal,production,active,..\\..\\..\\windows\\system32\\config\\sam
 null-byte,production,active,/etc/passwd\x00.txt
 relative-path,production,active,./config/../../../etc/shadow
 """
+
+
+class _LazyDict(Mapping):
+    """Read-only mapping that builds each value on first access.
+
+    Values are produced by zero-argument factories and cached, so a test
+    that only touches one key never pays for building the others.
+    """
+
+    def __init__(self, factories):
+        self._factories = dict(factories)
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            self._cache[key] = self._factories[key]()
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+
+@pytest.fixture(scope="session")
+def performance_test_data():
+    """Provide performance test data."""
+    return {
+        "small_dataset": 100,
+        "medium_dataset": 1000,
+        "large_dataset": 5000,
+        "csv_loading_threshold": 30.0,
+        "inventory_generation_threshold": 60.0,
+        "memory_usage_threshold": 200.0
     }
 
 
+@pytest.fixture(scope="session")
+def security_test_data():
+    """Provide security test data, built lazily per key."""
+    return _LazyDict({
+        "malicious_csv": _build_malicious_csv,
+        "malicious_headers": _build_malicious_headers,
+        "path_traversal_csv": _build_path_traversal_csv,
+    })
+
+
 @pytest.fixture(autouse=True)
 def setup_test_environment(tmp_path, monkeypatch):
     """Set up test environment for all tests."""
@@ -280,6 +525,14 @@ def setup_test_environment(tmp_path, monkeypatch):
     monkeypatch.setenv("LOG_LEVEL", "INFO")
 
 
+@pytest.fixture
+def set_argv(monkeypatch):
+    """Return a setter that replaces ``sys.argv`` for the current test."""
+    def _set(*args):
+        monkeypatch.setattr(sys, "argv", list(args))
+    return _set
+
+
 @pytest.fixture
 def mock_ansible_command():
     """Mock ansible command execution."""
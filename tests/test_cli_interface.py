@@ -241,9 +241,9 @@ class TestModularInventoryCLI:
         assert "❌ Error" in output
         assert "Test error" in output
     
-    @patch('sys.argv', ['ansible_inventory_cli.py', 'health'])
-    def test_run_success(self, capsys):
+    def test_run_success(self, capsys, set_argv):
         """Test successful CLI run."""
+        set_argv("ansible_inventory_cli.py", "health")
         cli = ModularInventoryCLI()
         
         # Mock the health command to avoid actual execution
@@ -257,17 +257,17 @@ class TestModularInventoryCLI:
             captured = capsys.readouterr()
             assert "✅ Success" in captured.out
     
-    @patch('sys.argv', ['ansible_inventory_cli.py', 'unknown'])
-    def test_run_unknown_command(self, capsys):
+    def test_run_unknown_command(self, capsys, set_argv):
         """Test CLI run with unknown command."""
+        set_argv("ansible_inventory_cli.py", "unknown")
         cli = ModularInventoryCLI()
         
         with pytest.raises(SystemExit):
             cli.run()
     
-    @patch('sys.argv', ['ansible_inventory_cli.py', '--version'])
-    def test_run_version(self, capsys):
+    def test_run_version(self, capsys, set_argv):
         """Test CLI version output."""
+        set_argv("ansible_inventory_cli.py", "--version")
         cli = ModularInventoryCLI()
         
         with pytest.raises(SystemExit):
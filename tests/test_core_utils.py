@@ -16,6 +16,8 @@ import pytest
 import yaml
 
 from scripts.core.utils import (
+    clear_csv_cache,
+    copy_file,
     create_backup_file,
     ensure_directory_exists,
     get_csv_template,
@@ -23,7 +25,9 @@ from scripts.core.utils import (
     get_hosts_by_status,
     get_logger,
     load_csv_data,
+    load_csv_rows,
     load_hosts_from_csv,
+    save_structured_file,
     save_yaml_file,
     setup_logging,
     test_ansible_inventory,
@@ -32,6 +36,7 @@ from scripts.core.utils import (
     validate_environment_decorator,
     validate_hostname_decorator,
 )
+from scripts.core._io import read_all, read_text, write_all
 from scripts.core.models import Host
 
 
@@ -66,6 +71,22 @@ class TestLoggingUtils:
 class TestFileUtils:
     """Test file utility functions."""
     
+    def test_read_all_and_read_text_return_file_contents(self, tmp_path):
+        """Test reading empty, small and large files in full."""
+        payload = b"hostname,environment\n" * 60000
+        for name, content in [("empty", b""), ("small", b"abc"), ("large", payload)]:
+            target = tmp_path / name
+            target.write_bytes(content)
+            assert read_all(target) == content
+            assert read_text(target) == content.decode("utf-8")
+    
+    def test_write_all_replaces_file_contents(self, tmp_path):
+        """Test writing creates a file and truncates previous contents."""
+        target = tmp_path / "out.yml"
+        write_all(target, b"first version\n")
+        write_all(target, b"second\n")
+        assert target.read_bytes() == b"second\n"
+    
     def test_ensure_directory_exists_new(self, tmp_path):
         """Test creating new directory."""
         new_dir = tmp_path / "new_directory"
@@ -91,6 +112,18 @@ class TestFileUtils:
         assert nested_dir.exists()
         assert nested_dir.is_dir()
     
+    def test_copy_file_preserves_content_and_mtime(self, tmp_path):
+        """Test that copy_file copies data and metadata."""
+        source = tmp_path / "source.csv"
+        source.write_text("hostname\nweb01\n" * 1000)
+        os.utime(source, (1_600_000_000, 1_600_000_000))
+        target = tmp_path / "target.csv"
+
+        copy_file(str(source), str(target))
+
+        assert target.read_text() == source.read_text()
+        assert target.stat().st_mtime == source.stat().st_mtime
+    
     def test_create_backup_file(self, tmp_path):
         """Test creating backup file."""
         original_file = tmp_path / "original.txt"
@@ -176,6 +209,84 @@ class TestCSVUtils:
         assert any(row["hostname"] == "web01" for row in data)
         assert any(row["hostname"] == "db01" for row in data)
     
+    def test_load_csv_data_rereads_modified_file(self, tmp_path):
+        """Test that cached CSV scans are refreshed when the file changes."""
+        csv_file = tmp_path / "changing.csv"
+        csv_file.write_text("hostname,environment,status\nweb01,production,active")
+
+        assert len(load_csv_data(csv_file)) == 1
+
+        csv_file.write_text(
+            "hostname,environment,status\nweb01,production,active\ndb01,development,active"
+        )
+
+        data = load_csv_data(csv_file)
+        assert [row["hostname"] for row in data] == ["web01", "db01"]
+
+    def test_cached_csv_still_checks_readability(self, tmp_path, monkeypatch):
+        """Test that a cached parse is not served once the file is unreadable."""
+        csv_file = tmp_path / "locked.csv"
+        csv_file.write_text("hostname,environment,status\nweb01,production,active")
+        assert len(load_hosts_from_csv(str(csv_file))) == 1
+
+        real_open = os.open
+
+        def deny(path, *args, **kwargs):
+            if Path(path) == csv_file:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "open", deny)
+        with pytest.raises(ValueError, match="Permission denied"):
+            load_hosts_from_csv(str(csv_file))
+
+    def test_load_csv_rows_is_lazy(self, tmp_path):
+        """Test that load_csv_rows yields the same rows as load_csv_data."""
+        csv_file = tmp_path / "lazy.csv"
+        csv_file.write_text(
+            "hostname,environment,status\n#comment,,\nweb01,production,active\ndb01,development,active"
+        )
+
+        rows = load_csv_rows(csv_file)
+
+        assert not isinstance(rows, list)
+        assert next(rows)["hostname"] == "web01"
+        assert list(load_csv_rows(csv_file)) == load_csv_data(csv_file)
+
+    def test_load_csv_rows_validates_eagerly(self, tmp_path):
+        """Test that missing files and fields fail before iteration."""
+        csv_file = tmp_path / "fields.csv"
+        csv_file.write_text("hostname,status\nweb01,active")
+
+        with pytest.raises(ValueError):
+            load_csv_rows(csv_file, required_fields=["environment"])
+        with pytest.raises(FileNotFoundError):
+            load_csv_rows(tmp_path / "missing.csv")
+
+    def test_load_csv_data_reuses_field_strings(self, tmp_path):
+        """Test that repeated loads share field strings instead of copying them."""
+        csv_file = tmp_path / "shared.csv"
+        csv_file.write_text("hostname,environment,status\nweb01,production,active")
+
+        first = load_csv_data(csv_file)[0]
+        second = load_csv_data(csv_file)[0]
+
+        assert first is not second
+        assert all(first[key] is second[key] for key in first)
+
+    def test_load_csv_data_cached_rows_are_copies(self, tmp_path):
+        """Test that modifying loaded rows does not leak into later loads."""
+        csv_file = tmp_path / "cached.csv"
+        csv_file.write_text("hostname,environment,status\nweb01,prd,active")
+
+        first = load_csv_data(csv_file)
+        first[0]["environment"] = "production"
+
+        assert load_csv_data(csv_file)[0]["environment"] == "prd"
+
+        clear_csv_cache()
+        assert load_csv_data(csv_file)[0]["environment"] == "prd"
+
     def test_load_csv_data_nonexistent_file(self, tmp_path):
         """Test loading nonexistent CSV file."""
         nonexistent = tmp_path / "nonexistent.csv"
@@ -183,6 +294,14 @@ class TestCSVUtils:
         with pytest.raises(FileNotFoundError):
             load_csv_data(nonexistent)
     
+    def test_load_csv_data_nonexistent_file_redacts_path(self):
+        """Test that home directories are masked in not-found errors."""
+        with pytest.raises(FileNotFoundError) as exc_info:
+            load_csv_data(Path("/home/nobody/hosts.csv"))
+        
+        assert "/home/" not in str(exc_info.value)
+        assert "nobody/hosts.csv" in str(exc_info.value)
+    
     def test_validate_csv_headers_valid(self):
         """Test validating valid CSV headers."""
         headers = ["hostname", "environment", "status", "application_service"]
@@ -229,6 +348,18 @@ class TestCSVUtils:
         assert not result.is_valid
         assert any("duplicate" in error.lower() for error in result.errors)
     
+    def test_validate_csv_structure_headers_only(self, tmp_path):
+        """Test that headers-only validation skips the data rows."""
+        csv_file = tmp_path / "headers_only.csv"
+        header = get_csv_template().splitlines()[0]
+        csv_file.write_text(f"{header}\nweb01,bogus\nweb01,bogus\n")
+        
+        result = validate_csv_structure(csv_file, headers_only=True)
+        
+        assert result.is_valid
+        assert len(result.errors) == 0
+        assert not validate_csv_structure(csv_file).is_valid
+    
     def test_get_csv_template(self):
         """Test getting CSV template."""
         template = get_csv_template()
@@ -392,6 +523,44 @@ class TestAnsibleIntegration:
         
         assert result["valid"] is False
         assert "ansible-inventory not found" in result["error"]
+    
+    def test_test_ansible_inventory_reuses_cached_result(self, monkeypatch):
+        """Test that repeated checks of an unchanged inventory run once."""
+        monkeypatch.setattr("scripts.core.utils._INVENTORY_TEST_CACHE", {})
+        with patch(
+            "scripts.core.utils.run_ansible_command",
+            return_value=(True, '{"all": {}}', ""),
+        ) as mock_run:
+            assert test_ansible_inventory() == (True, "")
+            assert test_ansible_inventory() == (True, "")
+            mock_run.assert_called_once()
+
+            assert test_ansible_inventory(use_cache=False) == (True, "")
+            assert mock_run.call_count == 2
+    
+    def test_test_ansible_inventory_does_not_cache_failures(self, monkeypatch):
+        """Test that a failed check is rerun instead of served from cache."""
+        monkeypatch.setattr("scripts.core.utils._INVENTORY_TEST_CACHE", {})
+        with patch(
+            "scripts.core.utils.run_ansible_command",
+            return_value=(False, "", "parse error"),
+        ) as mock_run:
+            assert test_ansible_inventory()[0] is False
+            mock_run.return_value = (True, '{"all": {}}', "")
+            assert test_ansible_inventory() == (True, "")
+            assert mock_run.call_count == 2
+    
+    def test_test_ansible_inventory_uncached_skips_fingerprint(self, monkeypatch):
+        """Test that use_cache=False does not walk the inventory tree."""
+        monkeypatch.setattr(
+            "scripts.core.utils._inventory_fingerprint",
+            lambda: pytest.fail("inventory fingerprinted without caching"),
+        )
+        with patch(
+            "scripts.core.utils.run_ansible_command",
+            return_value=(True, '{"all": {}}', ""),
+        ):
+            assert test_ansible_inventory(use_cache=False) == (True, "")
 
 
 class TestEdgeCases:
@@ -427,6 +596,65 @@ class TestEdgeCases:
         assert data[0]["hostname"] == "host0000"
         assert data[999]["hostname"] == "host0999"
     
+    def test_load_csv_data_parallel_tokenizing(self, tmp_path, monkeypatch):
+        """Test that threaded tokenizing matches the serial parse."""
+        monkeypatch.setattr("scripts.core.utils._PARALLEL_PARSE_THRESHOLD", 0)
+        monkeypatch.setattr("scripts.core.utils._gil_disabled", lambda: True)
+        monkeypatch.setattr("scripts.core.utils.os.cpu_count", lambda: 4)
+
+        lines = ["hostname,environment,status"]
+        lines += [f"host{i:04d},production,active" for i in range(250)]
+        parallel_file = tmp_path / "parallel.csv"
+        parallel_file.write_text("\r\n".join(lines) + "\r\n\r\n")
+        serial_file = tmp_path / "serial.csv"
+        serial_file.write_text('"hostname",environment,status\n' + "\n".join(lines[1:]))
+
+        data = load_csv_data(parallel_file)
+
+        assert len(data) == 250
+        assert data == load_csv_data(serial_file)
+    
+    def test_load_csv_data_arrow_backend(self, tmp_path, monkeypatch):
+        """Test that the optional pyarrow reader matches the stdlib parse."""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setattr("scripts.core.utils._ARROW_PARSE_THRESHOLD", 0)
+
+        csv_content = (
+            "hostname,environment,status,product_id,instance\n"
+            'web01,production,active,"a, b",01\n'
+            "\n"
+            "#disabled,production,active,,\n"
+            " db01 ,development,active,,2\n"
+        )
+        arrow_file = tmp_path / "arrow.csv"
+        arrow_file.write_text(csv_content)
+        ragged_file = tmp_path / "ragged.csv"
+        ragged_file.write_text(csv_content + "api01,test\n")
+
+        data = load_csv_data(arrow_file)
+
+        assert data == [
+            {"hostname": "web01", "environment": "production", "status": "active",
+             "product_id": "a,b", "instance": "01"},
+            {"hostname": "db01", "environment": "development", "status": "active",
+             "product_id": "", "instance": "2"},
+        ]
+        # Ragged rows fall back to the stdlib reader
+        assert load_csv_data(ragged_file)[:2] == data
+    
+    def test_load_csv_data_prefer_arrow_disabled(self, tmp_path, monkeypatch):
+        """Test that PREFER_ARROW=0 keeps the stdlib reader."""
+        monkeypatch.setattr("scripts.core.utils._ARROW_PARSE_THRESHOLD", 0)
+        monkeypatch.setenv("PREFER_ARROW", "0")
+        arrow_reader = MagicMock(return_value=None)
+        monkeypatch.setattr("scripts.core.utils._scan_csv_arrow", arrow_reader)
+
+        csv_file = tmp_path / "no_arrow.csv"
+        csv_file.write_text("hostname,environment,status\nweb01,production,active")
+
+        assert load_csv_data(csv_file)[0]["hostname"] == "web01"
+        arrow_reader.assert_not_called()
+    
     def test_save_yaml_file_complex_data(self, tmp_path):
         """Test saving complex YAML data."""
         yaml_file = tmp_path / "complex.yml"
@@ -453,6 +681,19 @@ class TestEdgeCases:
         loaded_data = yaml.safe_load(yaml_file.read_text())
         assert loaded_data == complex_data
     
+    def test_save_structured_file_dispatches_on_suffix(self, tmp_path):
+        """Test that .json files are written as JSON and others as YAML."""
+        data = {"hosts": ["web01", "web02"], "vars": {"environment": "prod"}}
+        json_file = tmp_path / "data.json"
+        yaml_file = tmp_path / "data.yml"
+
+        save_structured_file(data, str(json_file))
+        save_structured_file(data, str(yaml_file), "Generated")
+
+        assert json.loads(json_file.read_text()) == data
+        assert yaml_file.read_text().startswith("---\n# Generated\n")
+        assert yaml.safe_load(yaml_file.read_text()) == data
+    
     def test_ensure_directory_exists_permission_error(self, tmp_path):
         """Test directory creation with permission error."""
         # Create a directory and make it read-only
@@ -523,4 +764,28 @@ class TestPerformanceAndMemory:
         
         # Verify all operations completed successfully
         assert len(results) == 5
-        assert all(count == 1 for _, count in results) 
\ No newline at end of file
+        assert all(count == 1 for _, count in results)
+
+
+class TestConfigCache:
+    """Test configuration caching."""
+
+    def test_load_config_reloads_when_file_changes(self, tmp_path):
+        """Config should be reused until the file changes or the cache is reset."""
+        from scripts.core import config as config_module
+
+        config_file = tmp_path / "inventory-config.yml"
+        config_file.write_text("logging:\n  level: INFO\n")
+
+        with patch.object(config_module, "CONFIG_FILE", config_file):
+            first = config_module.load_config()
+            assert first["logging"]["level"] == "INFO"
+            assert config_module.load_config() is first
+
+            config_file.write_text("logging:\n  level: WARNING\n")
+            assert config_module.load_config()["logging"]["level"] == "WARNING"
+
+            config_module.reset_config_cache()
+            assert config_module.load_config() is not first
+
+        assert config_module.load_config()["paths"]
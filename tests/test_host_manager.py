@@ -53,6 +53,17 @@ class TestHostManager(unittest.TestCase):
         self.assertEqual(len(hosts), 3)
         self.assertEqual(hosts[0]["hostname"], "test-host-01")
 
+    def test_load_hosts_from_csv_raw_sees_same_size_rewrite(self):
+        """Test a rewrite keeping size and mtime is not served from cache."""
+        self.host_manager.load_hosts_from_csv_raw()
+        st = self.csv_file.stat()
+        content = self.csv_file.read_bytes().replace(b"test-host-01", b"test-host-09")
+        self.csv_file.write_bytes(content)
+        os.utime(self.csv_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        hosts = self.host_manager.load_hosts_from_csv_raw()
+        self.assertEqual(hosts[0]["hostname"], "test-host-09")
+
     def test_decommission_host_success(self):
         """Test successful host decommissioning."""
         with patch("scripts.managers.host_manager.HostManager.save_hosts_to_csv") as mock_save:
